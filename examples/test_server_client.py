@@ -2,19 +2,33 @@
 """Example client script for testing the Twitter OAuth2.0 server"""
 
 import requests
-import json
+import orjson
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from requests.adapters import HTTPAdapter
+
+try:
+    import readline  # noqa: F401 - line editing and history for input()
+except ImportError:
+    pass
 
 # Server configuration
 SERVER_HOST = "127.0.0.1"
 SERVER_PORT = 8000
 SERVER_URL = f"http://{SERVER_HOST}:{SERVER_PORT}"
 
+# Reuse one keep-alive connection pool for every request to the server
+SESSION = requests.Session()
+SESSION.mount("http://", HTTPAdapter(pool_connections=1, pool_maxsize=4))
+
+JSON_HEADERS = {"Content-Type": "application/json"}
+
 
 def check_server_health():
     """Check if the server is running"""
     try:
-        response = requests.get(f"{SERVER_URL}/health", timeout=2)
+        response = SESSION.get(f"{SERVER_URL}/health", timeout=2)
         if response.status_code == 200:
             print("✓ Server is running")
             return True
@@ -32,9 +46,9 @@ def check_server_health():
 def get_server_status():
     """Get server status and authentication info"""
     try:
-        response = requests.get(f"{SERVER_URL}/status")
+        response = SESSION.get(f"{SERVER_URL}/status")
         if response.status_code == 200:
-            data = response.json()
+            data = orjson.loads(response.content)
             print("\n--- Server Status ---")
             print(f"Authenticated: {data.get('authenticated')}")
             print(f"Username: {data.get('username')}")
@@ -56,14 +70,15 @@ def post_text_tweet(text):
     """Post a text-only tweet"""
     try:
         payload = {"text": text}
-        response = requests.post(
+        response = SESSION.post(
             f"{SERVER_URL}/tweet",
-            json=payload,
+            data=orjson.dumps(payload),
+            headers=JSON_HEADERS,
             timeout=5
         )
 
         if response.status_code == 200:
-            data = response.json()
+            data = orjson.loads(response.content)
             print(f"\n✓ Tweet posted successfully!")
             print(f"  Tweet ID: {data.get('tweet_id')}")
             print(f"  URL: https://x.com/search?q={data.get('tweet_id')}")
@@ -77,18 +92,25 @@ def post_text_tweet(text):
         return False
 
 
+def post_text_tweets(texts):
+    """Post several text tweets concurrently over the shared session"""
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        return list(executor.map(post_text_tweet, texts))
+
+
 def post_tweet_with_media(text, media_paths):
     """Post a tweet with media"""
     try:
         payload = {"text": text, "media_paths": media_paths}
-        response = requests.post(
+        response = SESSION.post(
             f"{SERVER_URL}/tweet-media",
-            json=payload,
+            data=orjson.dumps(payload),
+            headers=JSON_HEADERS,
             timeout=10
         )
 
         if response.status_code == 200:
-            data = response.json()
+            data = orjson.loads(response.content)
             print(f"\n✓ Tweet with media posted successfully!")
             print(f"  Tweet ID: {data.get('tweet_id')}")
             print(f"  Media count: {data.get('media_count')}")
@@ -102,6 +124,57 @@ def post_tweet_with_media(text, media_paths):
         return False
 
 
+def _prompt(message):
+    """Read one line from the terminal, or from piped stdin for scripted runs"""
+    if sys.stdin.isatty():
+        return input(message).strip()
+    line = sys.stdin.readline()
+    if not line:
+        raise EOFError
+    return line.strip()
+
+
+def _handle_text_tweet():
+    text = _prompt("Enter tweet text: ")
+    if text:
+        post_text_tweet(text)
+
+
+def _handle_media_tweet():
+    text = _prompt("Enter tweet text: ")
+    if text:
+        media_input = _prompt("Enter comma-separated media file paths: ")
+        media_paths = [p.strip() for p in media_input.split(",") if p.strip()]
+        if media_paths:
+            post_tweet_with_media(text, media_paths)
+        else:
+            print("No media paths provided")
+
+
+def _handle_text_tweets():
+    texts_input = _prompt("Enter tweet texts separated by '|': ")
+    texts = [t.strip() for t in texts_input.split("|") if t.strip()]
+    if texts:
+        results = post_text_tweets(texts)
+        print(f"\nPosted {sum(results)}/{len(texts)} tweet(s)")
+    else:
+        print("No tweet texts provided")
+
+
+def _handle_exit():
+    print("Goodbye!")
+    sys.exit(0)
+
+
+HANDLERS = {
+    "1": _handle_text_tweet,
+    "2": _handle_media_tweet,
+    "3": get_server_status,
+    "4": _handle_exit,
+    "5": _handle_text_tweets,
+}
+
+
 def main():
     """Interactive test client"""
     print("Twitter OAuth2.0 Server - Test Client")
@@ -114,41 +187,23 @@ def main():
     # Get status
     get_server_status()
 
-    # Interactive menu
+    # Interactive menu (also accepts piped commands, e.g. for load testing)
+    interactive = sys.stdin.isatty()
     while True:
-        print("\n--- Options ---")
-        print("1. Post a text tweet")
-        print("2. Post a tweet with media")
-        print("3. Check server status")
-        print("4. Exit")
-
-        choice = input("\nEnter your choice (1-4): ").strip()
-
-        if choice == "1":
-            text = input("Enter tweet text: ").strip()
-            if text:
-                post_text_tweet(text)
-
-        elif choice == "2":
-            text = input("Enter tweet text: ").strip()
-            if text:
-                media_input = input("Enter comma-separated media file paths: ").strip()
-                media_paths = [p.strip() for p in media_input.split(",") if p.strip()]
-                if media_paths:
-                    post_tweet_with_media(text, media_paths)
-                else:
-                    print("No media paths provided")
-
-        elif choice == "3":
-            get_server_status()
-
-        elif choice == "4":
-            print("Goodbye!")
+        if interactive:
+            print("\n--- Options ---")
+            print("1. Post a text tweet")
+            print("2. Post a tweet with media")
+            print("3. Check server status")
+            print("4. Exit")
+            print("5. Post several text tweets")
+
+        try:
+            choice = _prompt("\nEnter your choice (1-5): ")
+            HANDLERS.get(choice, lambda: print("Invalid choice"))()
+        except EOFError:
             break
 
-        else:
-            print("Invalid choice")
-
 
 if __name__ == "__main__":
     main()
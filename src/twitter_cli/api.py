@@ -2,8 +2,132 @@
 
 import requests
 import os
-from typing import Optional, List
+import orjson
+from typing import Optional, List, TYPE_CHECKING
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+from requests_toolbelt import MultipartEncoder
+
+from . import session
+from .session import SESSION as _SESSION
+
+if TYPE_CHECKING:
+    import httpx
+
+
+_TWEETS_URL = "https://api.x.com/2/tweets"
+_UPLOAD_URL = "https://upload.x.com/1.1/media/upload.json"
+_USERS_ME_URL = "https://api.x.com/2/users/me"
+_BEARER_PREFIX = "Bearer "
+
+# Supported media types and size limits
+_IMG_EXT = frozenset({'.jpg', '.jpeg', '.png', '.gif', '.webp'})
+_VID_EXT = frozenset({'.mp4', '.mov'})
+_SUPPORTED_EXT = ('.jpg', '.jpeg', '.png', '.gif', '.webp', '.mp4', '.mov')
+_MAX_SIZE = {'image': 15 << 20, 'video': 512 << 20}
+_MIME = {
+    '.jpg': 'image/jpeg',
+    '.jpeg': 'image/jpeg',
+    '.png': 'image/png',
+    '.gif': 'image/gif',
+    '.webp': 'image/webp',
+    '.mp4': 'video/mp4',
+    '.mov': 'video/quicktime',
+}
+
+# Async client for the HTTP server, created lazily so the CLI never imports httpx
+_ACLIENT: Optional["httpx.AsyncClient"] = None
+
+
+def close() -> None:
+    """Close the shared HTTP session and its pooled connections"""
+    session.close()
+
+
+def _get_async_client() -> "httpx.AsyncClient":
+    """Get the shared async HTTP client, creating it on first use"""
+    global _ACLIENT
+    if _ACLIENT is None:
+        import httpx
+
+        _ACLIENT = httpx.AsyncClient(
+            http2=True,
+            timeout=10,
+            limits=httpx.Limits(max_keepalive_connections=8, max_connections=16),
+            headers={"User-Agent": "twitter-cli"},
+        )
+    return _ACLIENT
+
+
+async def aclose() -> None:
+    """Close the shared async HTTP client, if it was created"""
+    global _ACLIENT
+    if _ACLIENT is not None:
+        await _ACLIENT.aclose()
+        _ACLIENT = None
+
+
+def _multipart_body(field: str, file_path: str, f, content_type: str) -> MultipartEncoder:
+    """Build a multipart body that streams the open file instead of buffering it"""
+    return MultipartEncoder(fields={field: (os.path.basename(file_path), f, content_type)})
+
+
+def _extract_error(response, exc: Exception) -> str:
+    """Get the X API error message from a failed response, or fall back to the exception"""
+    if response is None:
+        return str(exc)
+
+    try:
+        error_data = orjson.loads(response.content)
+    except orjson.JSONDecodeError:
+        return str(exc)
+
+    if not isinstance(error_data, dict):
+        return str(exc)
+
+    errors = error_data.get("errors")
+    if errors and isinstance(errors, list) and isinstance(errors[0], dict):
+        return errors[0].get("message", str(exc))
+    if "error" in error_data:
+        return str(error_data.get("error_description", error_data["error"]))
+    return str(exc)
+
+
+def _validate_media(path: str) -> tuple[str, int, str]:
+    """
+    Check that a media file exists and has a supported type and size.
+
+    Uses a single stat() call per file.
+
+    Returns:
+        (expanded_path, file_size, file_ext)
+
+    Raises:
+        RuntimeError: If the file is missing, unsupported, or too large
+    """
+    p = Path(path).expanduser()
+    try:
+        st = p.stat()
+    except FileNotFoundError:
+        raise RuntimeError(f"Media file not found: {p}")
+
+    file_ext = p.suffix.lower()
+
+    if file_ext in _IMG_EXT:
+        media_type = "image"
+    elif file_ext in _VID_EXT:
+        media_type = "video"
+    else:
+        raise RuntimeError(f"Unsupported file type: {file_ext}. Supported: {_SUPPORTED_EXT}")
+
+    max_size = _MAX_SIZE[media_type]
+    if st.st_size > max_size:
+        raise RuntimeError(
+            f"File too large: {p} ({st.st_size / (1024*1024):.1f}MB). "
+            f"Max size for {media_type}: {max_size / (1024*1024):.0f}MB"
+        )
+
+    return str(p), st.st_size, file_ext
 
 
 def upload_media(file_path: str, access_token: str) -> str:
@@ -22,64 +146,61 @@ def upload_media(file_path: str, access_token: str) -> str:
     Raises:
         RuntimeError: On upload error or invalid file
     """
-    file_path = os.path.expanduser(file_path)
-
-    if not os.path.exists(file_path):
-        raise RuntimeError(f"Media file not found: {file_path}")
-
-    file_size = os.path.getsize(file_path)
-
-    # Validate file type and size
-    valid_image_types = ('.jpg', '.jpeg', '.png', '.gif', '.webp')
-    valid_video_types = ('.mp4', '.mov')
-    file_ext = os.path.splitext(file_path)[1].lower()
-
-    if file_ext in valid_image_types:
-        max_size = 15 * 1024 * 1024  # 15MB for images
-        media_type = "image"
-    elif file_ext in valid_video_types:
-        max_size = 512 * 1024 * 1024  # 512MB for videos
-        media_type = "video"
-    else:
-        raise RuntimeError(f"Unsupported file type: {file_ext}. Supported: {valid_image_types + valid_video_types}")
-
-    if file_size > max_size:
-        raise RuntimeError(f"File too large. Max size for {media_type}: {max_size / (1024*1024):.0f}MB")
+    return _upload(
+        file_path,
+        access_token,
+        field="media_data",
+        timeout=30,
+        hint_403=" (Hint: Check that your app has 'Read and write' permissions in Twitter Developer Portal)",
+    )
+
+
+def _upload_attachment(file_path: str, access_token: str) -> str:
+    """Upload a file attached via post_tweet(media_files=...) and get its media_id"""
+    return _upload(
+        file_path,
+        access_token,
+        field="media",
+        timeout=60,
+        hint_403=(
+            "\n\nNote: Twitter's v1.1 media endpoint requires OAuth 1.0a signatures."
+            "\nYour app is using OAuth 2.0, which the v1.1 endpoint doesn't accept."
+            "\nConsider using the Twitter web interface or a tool with OAuth 1.0a support."
+        ),
+    )
+
+
+def _upload(file_path: str, access_token: str, field: str, timeout: int, hint_403: str) -> str:
+    """Validate and upload one media file as form field `field`, returning its media_id"""
+    file_path, _, file_ext = _validate_media(file_path)
 
     headers = {
-        "Authorization": f"Bearer {access_token}",
+        "Authorization": _BEARER_PREFIX + access_token,
     }
 
+    # Upload via multipart file upload (raw binary)
+    response = None
     try:
         with open(file_path, 'rb') as f:
-            files = {'media_data': f}
-            response = requests.post(
-                "https://upload.x.com/1.1/media/upload.json",
-                files=files,
-                headers=headers,
-                timeout=30,
+            body = _multipart_body(field, file_path, f, _MIME[file_ext])
+            response = _SESSION.post(
+                _UPLOAD_URL,
+                data=body,
+                headers={**headers, "Content-Type": body.content_type},
+                timeout=timeout,
             )
         response.raise_for_status()
     except requests.RequestException as e:
-        try:
-            error_data = response.json()
-            if "errors" in error_data:
-                error_msg = error_data["errors"][0].get("message", str(e))
-            elif "error" in error_data:
-                error_msg = error_data.get("error_description", error_data.get("error", str(e)))
-            else:
-                error_msg = str(e)
-        except Exception:
-            error_msg = str(e)
+        error_msg = _extract_error(response, e)
 
         # Check if 403 - might be permission issue
         if "403" in str(e):
-            error_msg += " (Hint: Check that your app has 'Read and write' permissions in Twitter Developer Portal)"
+            error_msg += hint_403
 
         raise RuntimeError(f"Failed to upload media: {error_msg}")
 
     try:
-        data = response.json()
+        data = orjson.loads(response.content)
         media_id = data.get("media_id_string") or str(data.get("media_id", ""))
         if not media_id:
             raise RuntimeError("No media_id in response")
@@ -88,16 +209,54 @@ def upload_media(file_path: str, access_token: str) -> str:
         raise RuntimeError(f"Invalid media upload response: {e}")
 
 
-def post_tweet(text: str, access_token: str, media_files: Optional[List[str]] = None) -> dict:
+def upload_media_files(media_files: List[str], access_token: str) -> List[str]:
     """
-    Post a tweet using X API v2 with optional media files.
+    Upload several media files concurrently and return their media_ids in order.
+
+    Note: The v1.1 media upload endpoint requires OAuth 1.0a signatures, but we're
+    using OAuth 2.0. This is a limitation of Twitter's API - they require OAuth 1.0a
+    for v1.1 endpoints and OAuth 2.0 for v2 endpoints, but v2 doesn't support media
+    uploads through the same mechanism.
+
+    Raises:
+        RuntimeError: If any file is invalid or fails to upload
+    """
+    return _upload_all(media_files, access_token, _upload_attachment)
+
+
+def _upload_all(media_files: List[str], access_token: str, upload) -> List[str]:
+    """Run upload(path, access_token) for each file concurrently, keeping input order"""
+    # Uploads are independent, so run them in parallel over the shared session pool
+    with ThreadPoolExecutor(max_workers=min(4, len(media_files))) as executor:
+        futures = [executor.submit(upload, path, access_token) for path in media_files]
+        try:
+            return [future.result() for future in futures]
+        except Exception as e:
+            for future in futures:
+                future.cancel()
+            if isinstance(e, RuntimeError):
+                raise
+            raise RuntimeError(f"Failed to upload media: {e}")
+
+
+def post_tweet(
+    text: str,
+    access_token: str,
+    media_files: Optional[List[str]] = None,
+    media_ids: Optional[List[str]] = None,
+    session: requests.Session = _SESSION,
+) -> dict:
+    """
+    Post a tweet using X API v2 with optional media.
 
     POST https://api.x.com/2/tweets
 
     Args:
         text: Tweet content
         access_token: Valid OAuth 2.0 access token
-        media_files: Optional list of file paths to media files to attach
+        media_files: Optional list of file paths to upload and attach
+        media_ids: Optional list of already-uploaded media IDs to attach
+        session: HTTP session to send the request on (shared pool by default)
 
     Returns:
         Response dict with tweet data
@@ -106,162 +265,101 @@ def post_tweet(text: str, access_token: str, media_files: Optional[List[str]] =
         RuntimeError: On API error with clear message
     """
     headers = {
-        "Authorization": f"Bearer {access_token}",
+        "Authorization": _BEARER_PREFIX + access_token,
         "Content-Type": "application/json",
     }
 
-    body = {"text": text}
-
-    # If media files provided, read them and send as multipart form data instead
+    # If media files provided, upload them first and attach the resulting IDs
     if media_files:
-        # For media, we need to use multipart/form-data instead of JSON
-        return _post_tweet_with_media(text, access_token, media_files)
+        media_ids = list(media_ids or []) + _upload_all(media_files, access_token, _upload_attachment)
 
+    body = {"text": text}
+    if media_ids:
+        body["media"] = {"media_ids": list(media_ids)}
+
+    response = None
     try:
-        response = requests.post(
-            "https://api.x.com/2/tweets",
-            json=body,
+        response = session.post(
+            _TWEETS_URL,
+            data=orjson.dumps(body),
             headers=headers,
             timeout=10,
         )
         response.raise_for_status()
     except requests.RequestException as e:
-        # Try to extract X API error message
-        try:
-            error_data = response.json()
-            if "errors" in error_data:
-                error_msg = error_data["errors"][0].get("message", str(e))
-            else:
-                error_msg = str(e)
-        except (ValueError, KeyError, IndexError):
-            error_msg = str(e)
-
-        raise RuntimeError(f"Failed to post tweet: {error_msg}")
+        raise RuntimeError(f"Failed to post tweet: {_extract_error(response, e)}")
 
     try:
-        data = response.json()
+        data = orjson.loads(response.content)
         return data.get("data", {})
     except ValueError as e:
         raise RuntimeError(f"Invalid tweet response: {e}")
 
 
-def _post_tweet_with_media(text: str, access_token: str, media_files: List[str]) -> dict:
+async def apost_tweet(text: str, access_token: str) -> dict:
     """
-    Post a tweet with media using the v1.1 endpoint with raw file uploads.
+    Post a text-only tweet without blocking the event loop.
 
-    Note: The v1.1 media upload endpoint requires OAuth 1.0a signatures, but we're
-    using OAuth 2.0. This is a limitation of Twitter's API - they require OAuth 1.0a
-    for v1.1 endpoints and OAuth 2.0 for v2 endpoints, but v2 doesn't support media
-    uploads through the same mechanism.
+    Async counterpart of post_tweet() for the HTTP server; concurrent calls
+    share one pooled (HTTP/2) connection to api.x.com.
 
-    Workaround: We'll use the v1.1 statuses/update endpoint directly via the legacy
-    API which should accept OAuth 2.0 Bearer tokens.
+    Raises:
+        RuntimeError: On API error with clear message
     """
-    import mimetypes
+    import httpx
 
     headers = {
-        "Authorization": f"Bearer {access_token}",
-    }
-
-    media_ids = []
-
-    for media_file in media_files:
-        media_file = os.path.expanduser(media_file)
-
-        if not os.path.exists(media_file):
-            raise RuntimeError(f"Media file not found: {media_file}")
-
-        file_size = os.path.getsize(media_file)
-        file_ext = os.path.splitext(media_file)[1].lower()
-
-        # Validate file type and size
-        valid_image_types = ('.jpg', '.jpeg', '.png', '.gif', '.webp')
-        valid_video_types = ('.mp4', '.mov')
-
-        if file_ext in valid_image_types:
-            max_size = 15 * 1024 * 1024  # 15MB for images
-        elif file_ext in valid_video_types:
-            max_size = 512 * 1024 * 1024  # 512MB for videos
-        else:
-            raise RuntimeError(f"Unsupported file type: {file_ext}. Supported: {valid_image_types + valid_video_types}")
-
-        if file_size > max_size:
-            raise RuntimeError(f"File too large: {media_file} ({file_size / (1024*1024):.1f}MB)")
-
-        # Upload via multipart file upload (raw binary)
-        with open(media_file, 'rb') as f:
-            files = {'media': f}
-            try:
-                response = requests.post(
-                    "https://upload.x.com/1.1/media/upload.json",
-                    files=files,
-                    headers=headers,
-                    timeout=60,
-                )
-                response.raise_for_status()
-            except requests.RequestException as e:
-                try:
-                    error_data = response.json()
-                    error_msg = error_data.get("error", str(e))
-                except Exception:
-                    error_msg = str(e)
-
-                if "403" in str(e):
-                    error_msg += "\n\nNote: Twitter's v1.1 media endpoint requires OAuth 1.0a signatures."
-                    error_msg += "\nYour app is using OAuth 2.0, which the v1.1 endpoint doesn't accept."
-                    error_msg += "\nConsider using the Twitter web interface or a tool with OAuth 1.0a support."
-
-                raise RuntimeError(f"Failed to upload media: {error_msg}")
-
-        try:
-            data = response.json()
-            media_id = data.get("media_id_string") or str(data.get("media_id", ""))
-            if not media_id:
-                raise RuntimeError("No media_id in response")
-            media_ids.append(media_id)
-        except (ValueError, KeyError) as e:
-            raise RuntimeError(f"Invalid media upload response: {e}")
-
-    # Now post the tweet with the media IDs
-    headers_json = {
-        "Authorization": f"Bearer {access_token}",
+        "Authorization": _BEARER_PREFIX + access_token,
         "Content-Type": "application/json",
     }
 
-    body = {
-        "text": text,
-        "media": {
-            "media_ids": media_ids
-        }
-    }
+    body = {"text": text}
 
+    response = None
     try:
-        response = requests.post(
-            "https://api.x.com/2/tweets",
-            json=body,
-            headers=headers_json,
-            timeout=10,
+        response = await _get_async_client().post(
+            _TWEETS_URL,
+            content=orjson.dumps(body),
+            headers=headers,
         )
         response.raise_for_status()
-    except requests.RequestException as e:
-        try:
-            error_data = response.json()
-            if "errors" in error_data:
-                error_msg = error_data["errors"][0].get("message", str(e))
-            else:
-                error_msg = str(e)
-        except Exception:
-            error_msg = str(e)
-
-        raise RuntimeError(f"Failed to post tweet: {error_msg}")
+    except httpx.HTTPError as e:
+        raise RuntimeError(f"Failed to post tweet: {_extract_error(response, e)}")
 
     try:
-        data = response.json()
+        data = orjson.loads(response.content)
         return data.get("data", {})
     except ValueError as e:
         raise RuntimeError(f"Invalid tweet response: {e}")
 
 
+async def aget_user_info(access_token: str) -> dict:
+    """
+    Get authenticated user info without blocking the event loop.
+
+    Async counterpart of oauth.get_user_info() for the HTTP server.
+
+    Raises:
+        RuntimeError: On API error with clear message
+    """
+    import httpx
+
+    headers = {"Authorization": _BEARER_PREFIX + access_token}
+
+    response = None
+    try:
+        response = await _get_async_client().get(_USERS_ME_URL, headers=headers)
+        response.raise_for_status()
+    except httpx.HTTPError as e:
+        raise RuntimeError(f"Failed to get user info: {_extract_error(response, e)}")
+
+    try:
+        data = orjson.loads(response.content)
+        return data.get("data", {})
+    except ValueError as e:
+        raise RuntimeError(f"Invalid user response: {e}")
+
+
 def get_tweet_url(tweet_id: str, username: str) -> str:
     """Generate X URL for a tweet"""
     return f"https://x.com/{username}/status/{tweet_id}"
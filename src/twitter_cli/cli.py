@@ -1,10 +1,90 @@
 """Click CLI commands for Twitter OAuth 2.0 authentication and tweeting"""
 
+import asyncio
 import click
-import webbrowser
+import functools
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from pathlib import Path
+
+from . import oauth, token_manager, api
+
+
+@functools.lru_cache(maxsize=1)
+def _fetch_username(access_token: str) -> str | None:
+    """Look up the username for an access token (memoized per process and on disk)"""
+    username = token_manager.load_cached_userinfo(access_token)
+    if username:
+        return username
+
+    username = oauth.get_user_info(access_token).get("username")
+    if username:
+        token_manager.save_cached_userinfo(access_token, username)
+    return username
+
+
+def _get_username(access_token: str, tokens: dict | None = None, default: str = "user") -> str:
+    """Get the cached username, falling back to a /users/me lookup"""
+    if tokens is None:
+        username = token_manager.get_username()
+    else:
+        username = tokens.get("username")
+    if username:
+        return username
+
+    username = _fetch_username(access_token)
+    if not username:
+        return default
+
+    # Backfill tokens.json so the next status/tweet answers from one file read
+    token_manager.save_username(username)
+    return username
+
+
+def _post_with_username(post, access_token: str, tokens: dict) -> tuple[dict, str]:
+    """Run post() while the username for the tweet URL is looked up, unless it's cached"""
+    username = tokens.get("username")
+    if username:
+        return post(), username
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        username_future = executor.submit(_get_username, access_token, tokens)
+        tweet_data = post()
+        return tweet_data, username_future.result()
+
 
-from . import oauth, token_manager, api, media_manager
+def _truncate(text: str, length: int) -> str:
+    """Shorten text to length characters, adding an ellipsis only if it was cut"""
+    return f"{text[:length]}..." if len(text) > length else text
+
+
+def _start_token_refresher(
+    stop_event: threading.Event, interval: int = 60, on_refresh=None
+) -> None:
+    """
+    Keep the stored access token fresh from a daemon thread until stop_event is set.
+
+    on_refresh, if given, is called with each new access token so long-lived
+    consumers holding a token in memory pick it up.
+    """
+    def run():
+        tokens = token_manager.load_tokens()
+        current = tokens["access_token"] if tokens else None
+        while not stop_event.wait(interval):
+            thread = token_manager.refresh_if_near_expiry()
+            if thread is None or on_refresh is None:
+                continue
+            thread.join()
+            tokens = token_manager.load_tokens()
+            if tokens and tokens["access_token"] != current:
+                current = tokens["access_token"]
+                on_refresh(current)
+
+    threading.Thread(target=run, daemon=True).start()
 
 
 @click.group()
@@ -30,6 +110,8 @@ def auth(client_id: str, client_secret: str):
 
     Guides user through browser-based OAuth flow.
     """
+    import webbrowser
+
     try:
         # Prompt for credentials if not provided
         if not client_id:
@@ -52,8 +134,10 @@ def auth(client_id: str, client_secret: str):
         auth_url = oauth.build_auth_url(client_id, redirect_uri, code_challenge, state)
 
         # Open browser
-        click.echo("\nOpening browser for authentication...")
-        click.echo(f"If browser doesn't open, visit: {auth_url}\n")
+        click.echo(
+            "\nOpening browser for authentication...\n"
+            f"If browser doesn't open, visit: {auth_url}\n"
+        )
         webbrowser.open(auth_url)
 
         # Start callback server
@@ -66,21 +150,29 @@ def auth(client_id: str, client_secret: str):
             authorization_code, code_verifier, client_id, client_secret, redirect_uri
         )
 
-        # Save tokens
-        token_manager.save_tokens(
-            token_data["access_token"],
-            token_data["refresh_token"],
-            token_data["expires_in"],
-            token_data.get("scope", ""),
-        )
+        # Get user info while the tokens are being saved
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            user_future = executor.submit(oauth.get_user_info, token_data["access_token"])
+
+            # Save tokens
+            token_manager.save_tokens(
+                token_data["access_token"],
+                token_data["refresh_token"],
+                token_data["expires_in"],
+                token_data.get("scope", ""),
+            )
+
+            click.echo("Retrieving user information...")
+            user_info = user_future.result()
 
-        # Get user info
-        click.echo("Retrieving user information...")
-        user_info = oauth.get_user_info(token_data["access_token"])
         username = user_info.get("username", "user")
+        if user_info.get("username"):
+            token_manager.save_username(user_info["username"])
 
-        click.echo(f"\n✓ Successfully authenticated as @{username}")
-        click.echo(f"Access token expires at: {token_manager.get_token_expiration_time()}")
+        click.echo(
+            f"\n✓ Successfully authenticated as @{username}\n"
+            f"Access token expires at: {token_manager.get_token_expiration_time()}"
+        )
 
     except Exception as e:
         click.echo(f"✗ Authentication failed: {e}", err=True)
@@ -96,23 +188,21 @@ def tweet(text: str):
     Usage: twitter-cli tweet "Hello world"
     """
     try:
-        # Check if authenticated
-        if not token_manager.is_authenticated():
+        # Get valid access token (auto-refresh if expired)
+        try:
+            access_token, tokens = token_manager.get_valid_access_token_or_none()
+        except token_manager.NotAuthenticated:
             click.echo(
                 "✗ Not authenticated. Run 'twitter-cli auth' first.", err=True
             )
             raise SystemExit(1)
 
-        # Get valid access token (auto-refresh if expired)
         click.echo("Posting tweet...")
-        access_token = token_manager.get_valid_access_token()
-
-        # Post tweet
-        tweet_data = api.post_tweet(text, access_token)
 
-        # Get user info to build URL
-        user_info = oauth.get_user_info(access_token)
-        username = user_info.get("username", "user")
+        # Post tweet (and get username to build URL)
+        tweet_data, username = _post_with_username(
+            lambda: api.post_tweet(text, access_token), access_token, tokens
+        )
         tweet_id = tweet_data.get("id", "")
 
         if tweet_id:
@@ -129,37 +219,42 @@ def tweet(text: str):
         raise SystemExit(1)
 
 
-@cli.command()
+@cli.command("tweet-media-oauth2")
 @click.argument("text")
 @click.argument("media_paths", nargs=-1, required=True)
-def tweet_media(text: str, media_paths):
+def tweet_media_oauth2(text: str, media_paths):
     """
-    Post a tweet with pictures and/or videos.
+    Post a tweet with pictures and/or videos using the OAuth 2.0 login.
 
-    Usage: twitter-cli tweet-media "Check this out!" /pictures/photo.jpg /videos/clip.mp4
+    Usage: twitter-cli tweet-media-oauth2 "Check this out!" /pictures/photo.jpg /videos/clip.mp4
+
+    Note: X's v1.1 media upload endpoint usually rejects OAuth 2.0 tokens;
+    use 'twitter-cli tweet-media' (OAuth 1.0a) if uploads fail with 403.
     """
     try:
-        # Check if authenticated
-        if not token_manager.is_authenticated():
+        # Get valid access token (auto-refresh if expired)
+        try:
+            access_token, tokens = token_manager.get_valid_access_token_or_none()
+        except token_manager.NotAuthenticated:
             click.echo(
                 "✗ Not authenticated. Run 'twitter-cli auth' first.", err=True
             )
             raise SystemExit(1)
 
-        # Get valid access token (auto-refresh if expired)
-        access_token = token_manager.get_valid_access_token()
-
         # Post tweet with media (uploads handled internally)
-        click.echo(f"Processing {len(media_paths)} media file(s)...")
-        for i, media_path in enumerate(media_paths, 1):
-            click.echo(f"  [{i}/{len(media_paths)}] {media_path}")
+        total = len(media_paths)
+        click.echo(
+            f"Processing {total} media file(s)...\n"
+            + "\n".join(f"  [{i}/{total}] {media_path}" for i, media_path in enumerate(media_paths, 1))
+        )
 
-        click.echo("Uploading and posting tweet...")
-        tweet_data = api.post_tweet(text, access_token, media_files=list(media_paths))
+        click.echo("Uploading media...")
+        media_ids = api.upload_media_files(list(media_paths), access_token)
 
-        # Get user info to build URL
-        user_info = oauth.get_user_info(access_token)
-        username = user_info.get("username", "user")
+        click.echo("Posting tweet...")
+        tweet_data, username = _post_with_username(
+            lambda: api.post_tweet(text, access_token, media_ids=media_ids), access_token, tokens
+        )
         tweet_id = tweet_data.get("id", "")
 
         if tweet_id:
@@ -184,31 +279,25 @@ def status():
     Displays authentication status, username, token expiration, and scopes.
     """
     try:
-        if not token_manager.is_authenticated():
+        try:
+            access_token, tokens = token_manager.get_valid_access_token_or_none()
+        except token_manager.NotAuthenticated:
             click.echo("✗ Not authenticated. Run 'twitter-cli auth' to get started.")
             return
 
-        # Load tokens to get info
-        tokens = token_manager.load_tokens()
-        config = token_manager.load_config()
-
-        if not tokens or not config:
-            click.echo("✗ Configuration incomplete")
-            return
-
         # Get user info
-        access_token = token_manager.get_valid_access_token()
-        user_info = oauth.get_user_info(access_token)
-        username = user_info.get("username", "unknown")
+        username = _get_username(access_token, tokens, default="unknown")
 
         # Get expiration time
-        expires_at = token_manager.get_token_expiration_time()
-        expires_str = expires_at.strftime("%Y-%m-%d %H:%M:%S") if expires_at else "Unknown"
+        expires_str = datetime.fromtimestamp(tokens["expires_at"]).strftime("%Y-%m-%d %H:%M:%S")
 
-        click.echo(f"✓ Authenticated as @{username}")
-        click.echo(f"Access token expires: {expires_str}")
-        click.echo(f"Refresh token: valid")
-        click.echo(f"Scopes: {tokens.get('scope', 'unknown')}")
+        lines = [
+            f"✓ Authenticated as @{username}",
+            f"Access token expires: {expires_str}",
+            "Refresh token: valid",
+            f"Scopes: {tokens.get('scope', 'unknown')}",
+        ]
+        click.echo("\n".join(lines))
 
     except RuntimeError as e:
         click.echo(f"✗ Error: {e}", err=True)
@@ -232,6 +321,7 @@ def logout():
 
         if click.confirm("Are you sure you want to logout?"):
             token_manager.clear_tokens()
+            _fetch_username.cache_clear()
             click.echo("✓ Logged out successfully")
             click.echo("Run 'twitter-cli auth' to authenticate again")
         else:
@@ -278,6 +368,8 @@ def auth_media(consumer_key: str, consumer_secret: str, access_token: str, acces
        - Access Token
        - Access Token Secret
     """
+    from . import media_manager
+
     try:
         # Prompt for credentials if not provided
         if not consumer_key:
@@ -304,7 +396,7 @@ def auth_media(consumer_key: str, consumer_secret: str, access_token: str, acces
         raise SystemExit(1)
 
 
-@cli.command()
+@cli.command("tweet-media")
 @click.argument("text")
 @click.argument("media_paths", nargs=-1, required=True)
 def tweet_media(text: str, media_paths):
@@ -315,6 +407,8 @@ def tweet_media(text: str, media_paths):
 
     Note: You must run 'twitter-cli auth-media' first to set up OAuth 1.0a credentials.
     """
+    from . import media_manager
+
     try:
         # Check if media credentials are set up
         if not media_manager.has_media_credentials():
@@ -324,9 +418,11 @@ def tweet_media(text: str, media_paths):
             raise SystemExit(1)
 
         # Post tweet with media
-        click.echo(f"Processing {len(media_paths)} media file(s)...")
-        for i, media_path in enumerate(media_paths, 1):
-            click.echo(f"  [{i}/{len(media_paths)}] {media_path}")
+        total = len(media_paths)
+        click.echo(
+            f"Processing {total} media file(s)...\n"
+            + "\n".join(f"  [{i}/{total}] {media_path}" for i, media_path in enumerate(media_paths, 1))
+        )
 
         click.echo("Uploading and posting tweet...")
         tweet_data = media_manager.post_tweet_with_media(text, list(media_paths))
@@ -353,6 +449,8 @@ def logout_media():
 
     Removes stored media authentication credentials.
     """
+    from . import media_manager
+
     try:
         if not media_manager.has_media_credentials():
             click.echo("Media credentials not found")
@@ -371,13 +469,87 @@ def logout_media():
 
 
 # Auto-tweet commands
-import sys
-import os
+# Add Auto-Tweet to path once, if available
+AUTO_TWEET_PATH = str(Path(__file__).resolve().parent.parent.parent / "Auto-Tweet")
+if os.path.exists(AUTO_TWEET_PATH) and AUTO_TWEET_PATH not in sys.path:
+    sys.path.insert(0, AUTO_TWEET_PATH)
+
+# Auto-Tweet classes, resolved once by _load_auto_tweet()
+AutoTweeter = None
+TweetScheduler = None
+
+
+def _load_auto_tweet(with_scheduler: bool = False) -> None:
+    """Import the Auto-Tweet classes on first use (raises ImportError if unavailable)"""
+    global AutoTweeter, TweetScheduler
+    if AutoTweeter is None:
+        from auto_tweeter import AutoTweeter
+    if with_scheduler and TweetScheduler is None:
+        from scheduler import TweetScheduler
+
+
+@functools.lru_cache(maxsize=1)
+def _get_auto_tweeter():
+    """Get the shared AutoTweeter instance"""
+    _load_auto_tweet()
+    return AutoTweeter()
+
+
+@functools.lru_cache(maxsize=1)
+def _healthy(ttl_bucket: int) -> bool:
+    return _get_auto_tweeter().qwen.health_check()
+
+
+def _qwen_healthy() -> bool:
+    """Check the Qwen LLM connection, memoized for up to 60 seconds"""
+    return _healthy(int(time.time() // 60))
+
+
+async def _generate_and_post(auto_tweeter, access_token: str, count: int) -> list:
+    """
+    Generate and post tweets one at a time, fetching the next docs while posting.
+
+    post_tweet records each angle and tweet in the Auto-Tweet log, and
+    generate_tweet_angle reads that log to avoid repeats, so every post finishes
+    before the next angle is generated. Only the documentation fetch overlaps a post.
+    """
+    def fetch() -> dict:
+        try:
+            return {"content": auto_tweeter.fetch_kubernetes_content()}
+        except Exception as e:
+            return {"error": str(e)}
+
+    def generate(fetched: dict) -> dict:
+        if "error" in fetched:
+            return fetched
+        try:
+            angle = auto_tweeter.generate_tweet_angle(fetched["content"])
+            tweet_text = auto_tweeter.qwen.generate_tweet_from_angle(angle)
+            return {"angle": angle, "tweet": tweet_text}
+        except Exception as e:
+            return {"error": str(e)}
+
+    def post(item: dict) -> dict:
+        if "error" in item:
+            return {"success": False, **item}
+        try:
+            auto_tweeter.post_tweet(item["tweet"], access_token, angle=item["angle"])
+            return {"success": True, **item}
+        except Exception as e:
+            return {"success": False, "error": str(e), **item}
+
+    results = []
+    next_fetch = asyncio.create_task(asyncio.to_thread(fetch))
+    for i in range(count):
+        fetched = await next_fetch
+        # Start fetching the next tweet's docs while this one is generated and posted
+        if i + 1 < count:
+            next_fetch = asyncio.create_task(asyncio.to_thread(fetch))
 
-# Add Auto-Tweet to path if available
-auto_tweet_path = os.path.join(os.path.dirname(__file__), '../../Auto-Tweet')
-if os.path.exists(auto_tweet_path):
-    sys.path.insert(0, auto_tweet_path)
+        item = await asyncio.to_thread(generate, fetched)
+        results.append(await asyncio.to_thread(post, item))
+
+    return results
 
 
 @cli.command()
@@ -394,37 +566,26 @@ def auto_tweet_once(angle: str):
     Tracks angles and tweets to avoid repetition.
     """
     try:
-        if not token_manager.is_authenticated():
+        try:
+            access_token, tokens = token_manager.get_valid_access_token_or_none()
+        except token_manager.NotAuthenticated:
             click.echo(
                 "✗ Not authenticated. Run 'twitter-cli auth' first.", err=True
             )
             raise SystemExit(1)
 
-        import sys
-        from pathlib import Path
-
-        # Add Auto-Tweet to path
-        auto_tweet_path = str(Path(__file__).parent.parent.parent / "Auto-Tweet")
-        if auto_tweet_path not in sys.path:
-            sys.path.insert(0, auto_tweet_path)
-
-        from auto_tweeter import AutoTweeter
-
         click.echo("Initializing auto-tweeter...")
-        auto_tweeter = AutoTweeter()
+        auto_tweeter = _get_auto_tweeter()
 
         # Check LLM health
         click.echo("Checking Qwen LLM connection...")
-        if not auto_tweeter.qwen.health_check():
+        if not _qwen_healthy():
             click.echo(
                 "✗ Cannot connect to Qwen LLM. Ensure LMStudio is running at http://192.168.1.98:1234/v1",
                 err=True
             )
             raise SystemExit(1)
 
-        # Get access token
-        access_token = token_manager.get_valid_access_token()
-
         # Generate tweet
         click.echo("Fetching Kubernetes documentation...")
         kubernetes_content = auto_tweeter.fetch_kubernetes_content()
@@ -446,8 +607,7 @@ def auto_tweet_once(angle: str):
             tweet_id = tweet_data.get("id", "")
 
             if tweet_id:
-                user_info = oauth.get_user_info(access_token)
-                username = user_info.get("username", "user")
+                username = _get_username(access_token, tokens)
                 tweet_url = api.get_tweet_url(tweet_id, username)
                 click.echo(f"✓ Tweet posted: {tweet_url}")
             else:
@@ -476,44 +636,41 @@ def auto_tweet_batch(count: int):
     Each tweet will have a unique angle based on Kubernetes documentation.
     """
     try:
-        if not token_manager.is_authenticated():
+        try:
+            access_token, tokens = token_manager.get_valid_access_token_or_none()
+        except token_manager.NotAuthenticated:
             click.echo(
                 "✗ Not authenticated. Run 'twitter-cli auth' first.", err=True
             )
             raise SystemExit(1)
 
-        import sys
-        from pathlib import Path
-
-        # Add Auto-Tweet to path
-        auto_tweet_path = str(Path(__file__).parent.parent.parent / "Auto-Tweet")
-        if auto_tweet_path not in sys.path:
-            sys.path.insert(0, auto_tweet_path)
-
-        from auto_tweeter import AutoTweeter
+        # Refresh a soon-to-expire token while the LLM is being checked
+        refresh_thread = token_manager.refresh_if_near_expiry(tokens=tokens)
 
         click.echo("Initializing auto-tweeter...")
-        auto_tweeter = AutoTweeter()
+        auto_tweeter = _get_auto_tweeter()
 
         # Check LLM health
         click.echo("Checking Qwen LLM connection...")
-        if not auto_tweeter.qwen.health_check():
+        if not _qwen_healthy():
             click.echo(
                 "✗ Cannot connect to Qwen LLM. Ensure LMStudio is running at http://192.168.1.98:1234/v1",
                 err=True
             )
             raise SystemExit(1)
 
-        # Get access token
-        access_token = token_manager.get_valid_access_token()
+        # Pick up the refreshed access token
+        if refresh_thread:
+            refresh_thread.join()
+            access_token = token_manager.get_valid_access_token()
 
         click.echo(f"Generating and posting {count} tweet(s)...")
-        results = auto_tweeter.auto_tweet(access_token, count=count)
+        results = asyncio.run(_generate_and_post(auto_tweeter, access_token, count))
 
         for i, result in enumerate(results, 1):
             click.echo(f"\n[{i}/{count}]")
             if result.get("success"):
-                tweet_text = result.get("tweet", "")[:60] + "..."
+                tweet_text = _truncate(result.get("tweet", ""), 60)
                 angle = result.get("angle", "")
                 click.echo(f"  Angle: {angle}")
                 click.echo(f"  Tweet: {tweet_text}")
@@ -547,45 +704,39 @@ def auto_tweet_schedule(hours: str):
     Tweets will be generated from Kubernetes documentation and posted at specified times.
     """
     try:
-        if not token_manager.is_authenticated():
+        try:
+            access_token, tokens = token_manager.get_valid_access_token_or_none()
+        except token_manager.NotAuthenticated:
             click.echo(
                 "✗ Not authenticated. Run 'twitter-cli auth' first.", err=True
             )
             raise SystemExit(1)
 
-        import sys
-        from pathlib import Path
-
-        # Add Auto-Tweet to path
-        auto_tweet_path = str(Path(__file__).parent.parent.parent / "Auto-Tweet")
-        if auto_tweet_path not in sys.path:
-            sys.path.insert(0, auto_tweet_path)
-
-        from auto_tweeter import AutoTweeter
-        from scheduler import TweetScheduler
+        _load_auto_tweet(with_scheduler=True)
 
         click.echo("Initializing scheduler...")
-        auto_tweeter = AutoTweeter()
+        auto_tweeter = _get_auto_tweeter()
 
         # Check LLM health
         click.echo("Checking Qwen LLM connection...")
-        if not auto_tweeter.qwen.health_check():
+        if not _qwen_healthy():
             click.echo(
                 "✗ Cannot connect to Qwen LLM. Ensure LMStudio is running at http://192.168.1.98:1234/v1",
                 err=True
             )
             raise SystemExit(1)
 
-        # Get access token
-        access_token = token_manager.get_valid_access_token()
-
         # Parse hours
         if hours:
             try:
-                hour_list = [int(h.strip()) for h in hours.split(",")]
-                for h in hour_list:
-                    if not (0 <= h <= 23):
-                        raise ValueError(f"Invalid hour: {h}. Must be 0-23.")
+                # A set drops duplicate hours, which would otherwise double-post
+                hour_set = {int(h) for h in hours.split(",") if h.strip()}
+                if not hour_set:
+                    raise ValueError("no hours given")
+                invalid = [h for h in hour_set if not (0 <= h <= 23)]
+                if invalid:
+                    raise ValueError(f"Invalid hour: {min(invalid)}. Must be 0-23.")
+                hour_list = sorted(hour_set)
             except ValueError as e:
                 click.echo(f"✗ Invalid hours format: {e}", err=True)
                 raise SystemExit(1)
@@ -606,26 +757,36 @@ def auto_tweet_schedule(hours: str):
         click.echo("Starting scheduler in background...")
         scheduler.start()
 
-        # Show scheduled jobs
-        jobs = scheduler.get_scheduled_jobs()
+        # Refresh the access token ahead of expiry, off the posting path, and hand
+        # each new token to the scheduler, which otherwise keeps posting with the
+        # one it was constructed with
+        stop_event = threading.Event()
+
+        def update_scheduler_token(new_token: str) -> None:
+            scheduler.access_token = new_token
+
+        _start_token_refresher(stop_event, on_refresh=update_scheduler_token)
+
+        # Show scheduled jobs, soonest first (fetched once)
+        jobs = sorted(scheduler.get_scheduled_jobs(), key=lambda job: str(job["next_run"]))
         click.echo(f"✓ Scheduler is now running with {len(jobs)} job(s)")
         click.echo("\nScheduled jobs:")
-        for job in jobs:
-            click.echo(f"  - Next run: {job['next_run']}")
+        click.echo("\n".join(f"  - Next run: {job['next_run']}" for job in jobs))
 
         click.echo("\nScheduler is running in the background.")
         click.echo("Keep this CLI running to maintain scheduled tweets.")
         click.echo("Press Ctrl+C to stop the scheduler.\n")
 
-        # Keep running until interrupted
+        # Wait in 1s slices: an untimed wait can't be interrupted by Ctrl+C on Windows
         try:
-            while True:
-                import time
-                time.sleep(1)
+            while not stop_event.wait(1):
+                pass
         except KeyboardInterrupt:
-            click.echo("\nStopping scheduler...")
-            scheduler.stop()
-            click.echo("✓ Scheduler stopped")
+            stop_event.set()
+
+        click.echo("\nStopping scheduler...")
+        scheduler.stop()
+        click.echo("✓ Scheduler stopped")
 
     except RuntimeError as e:
         click.echo(f"✗ Error: {e}", err=True)
@@ -643,17 +804,8 @@ def auto_tweet_stats():
     Displays number of tweets posted and angles used.
     """
     try:
-        import sys
-        from pathlib import Path
-
-        # Add Auto-Tweet to path if not already there
-        auto_tweet_path = str(Path(__file__).parent.parent.parent / "Auto-Tweet")
-        if auto_tweet_path not in sys.path:
-            sys.path.insert(0, auto_tweet_path)
-
-        from auto_tweeter import AutoTweeter
 
-        auto_tweeter = AutoTweeter()
+        auto_tweeter = _get_auto_tweeter()
         stats = auto_tweeter.get_stats()
 
         click.echo("Auto-Tweet Statistics:")
@@ -667,7 +819,7 @@ def auto_tweet_stats():
         if recent:
             click.echo("\nRecent tweets:")
             for tweet in recent:
-                text = tweet.get("text", "")[:60] + "..."
+                text = _truncate(tweet.get("text", ""), 60)
                 angle = tweet.get("angle", "N/A")
                 timestamp = tweet.get("timestamp", "")[:10]
                 click.echo(f"  [{timestamp}] {text}")
@@ -1,11 +1,30 @@
 """Tweepy-based media posting using OAuth 1.0a"""
 
 import os
-import json
+import orjson
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Tuple
 
 
+VALID_IMAGE_TYPES = ('.jpg', '.jpeg', '.png', '.gif', '.webp')
+VALID_VIDEO_TYPES = ('.mp4', '.mov')
+
+# Max upload size per extension: 15MB for images, 512MB for videos
+_EXT_MAX_SIZE = {
+    **{ext: 15 * 1024 * 1024 for ext in VALID_IMAGE_TYPES},
+    **{ext: 512 * 1024 * 1024 for ext in VALID_VIDEO_TYPES},
+}
+
+# APPEND chunk size for video uploads (tweepy defaults to 1MB, allows up to 5MB)
+_VIDEO_CHUNK_SIZE = 4 * 1024 * 1024
+
+_REQUIRED_KEYS = frozenset({"consumer_key", "consumer_secret", "access_token", "access_token_secret"})
+
+# Parsed media_credentials.json, validated against the file's (mtime_ns, size)
+_CREDS_CACHE = {"key": None, "data": {}}
+
+
 def get_media_credentials_path() -> Path:
     """Get path to media credentials file (~/.twitter_cli/media_credentials.json)"""
     credentials_dir = Path.home() / ".twitter_cli"
@@ -23,28 +42,71 @@ def save_media_credentials(consumer_key: str, consumer_secret: str, access_token
         "access_token_secret": access_token_secret,
     }
 
-    with open(creds_path, "w") as f:
-        json.dump(credentials, f)
+    with open(creds_path, "wb") as f:
+        f.write(orjson.dumps(credentials))
 
     os.chmod(creds_path, 0o600)  # Secure file permissions
+    _CREDS_CACHE["key"] = None
 
 
 def load_media_credentials() -> dict:
     """Load OAuth 1.0a credentials for media posting"""
     creds_path = get_media_credentials_path()
 
-    if not creds_path.exists():
+    try:
+        st = creds_path.stat()
+    except FileNotFoundError:
         return {}
 
-    with open(creds_path, "r") as f:
-        return json.load(f)
+    # Only re-read the file when it has changed since the last load
+    key = (st.st_mtime_ns, st.st_size)
+    if _CREDS_CACHE["key"] != key:
+        with open(creds_path, "rb") as f:
+            _CREDS_CACHE["data"] = orjson.loads(f.read())
+        _CREDS_CACHE["key"] = key
+
+    return dict(_CREDS_CACHE["data"])
 
 
 def has_media_credentials() -> bool:
     """Check if media credentials are saved"""
-    creds = load_media_credentials()
-    required_keys = {"consumer_key", "consumer_secret", "access_token", "access_token_secret"}
-    return required_keys.issubset(creds.keys())
+    return _REQUIRED_KEYS.issubset(load_media_credentials().keys())
+
+
+def _validate_media(media_files: list) -> list[tuple[str, str, int]]:
+    """
+    Check every media file exists and has a supported type and size.
+
+    Returns:
+        List of (expanded_path, extension, size) tuples, in input order
+
+    Raises:
+        RuntimeError: On the first missing, unsupported or oversized file
+    """
+    validated = []
+    for media_file in media_files:
+        media_file = os.path.expanduser(media_file)
+
+        try:
+            file_size = os.stat(media_file).st_size
+        except FileNotFoundError:
+            raise RuntimeError(f"Media file not found: {media_file}")
+
+        # Validate file type and size
+        file_ext = os.path.splitext(media_file)[1].lower()
+        max_size = _EXT_MAX_SIZE.get(file_ext)
+        if max_size is None:
+            raise RuntimeError(
+                f"Unsupported file type: {file_ext}. Supported: {VALID_IMAGE_TYPES + VALID_VIDEO_TYPES}"
+            )
+
+        if file_size > max_size:
+            raise RuntimeError(
+                f"File too large: {media_file} ({file_size / (1024*1024):.1f}MB)"
+            )
+        validated.append((media_file, file_ext, file_size))
+
+    return validated
 
 
 def post_tweet_with_media(text: str, media_files: list) -> dict:
@@ -61,6 +123,9 @@ def post_tweet_with_media(text: str, media_files: list) -> dict:
     Raises:
         RuntimeError: If credentials not found or tweet posting fails
     """
+    # Fail fast on bad files before loading credentials or tweepy
+    validated = _validate_media(media_files)
+
     try:
         import tweepy
     except ImportError:
@@ -70,39 +135,11 @@ def post_tweet_with_media(text: str, media_files: list) -> dict:
 
     # Load credentials
     creds = load_media_credentials()
-    if not has_media_credentials():
+    if not _REQUIRED_KEYS.issubset(creds.keys()):
         raise RuntimeError(
             "Media credentials not found. Run 'twitter-cli auth-media' first to set up OAuth 1.0a"
         )
 
-    # Validate media files
-    for media_file in media_files:
-        media_file = os.path.expanduser(media_file)
-
-        if not os.path.exists(media_file):
-            raise RuntimeError(f"Media file not found: {media_file}")
-
-        file_size = os.path.getsize(media_file)
-        file_ext = os.path.splitext(media_file)[1].lower()
-
-        # Validate file type and size
-        valid_image_types = ('.jpg', '.jpeg', '.png', '.gif', '.webp')
-        valid_video_types = ('.mp4', '.mov')
-
-        if file_ext in valid_image_types:
-            max_size = 15 * 1024 * 1024  # 15MB for images
-        elif file_ext in valid_video_types:
-            max_size = 512 * 1024 * 1024  # 512MB for videos
-        else:
-            raise RuntimeError(
-                f"Unsupported file type: {file_ext}. Supported: {valid_image_types + valid_video_types}"
-            )
-
-        if file_size > max_size:
-            raise RuntimeError(
-                f"File too large: {media_file} ({file_size / (1024*1024):.1f}MB)"
-            )
-
     try:
         # Create OAuth 1.0a handler
         auth = tweepy.OAuthHandler(creds["consumer_key"], creds["consumer_secret"])
@@ -111,15 +148,29 @@ def post_tweet_with_media(text: str, media_files: list) -> dict:
         # Create API client
         api = tweepy.API(auth)
 
-        # Upload media files
-        media_ids = []
-        for media_file in media_files:
-            media_file = os.path.expanduser(media_file)
+        def upload(media: tuple[str, str, int]) -> str:
+            media_file, file_ext, _ = media
             try:
-                response = api.media_upload(media_file)
-                media_ids.append(str(response.media_id))
+                if file_ext in VALID_VIDEO_TYPES:
+                    # Larger chunks mean fewer APPEND round-trips for big videos
+                    with open(media_file, "rb", buffering=_VIDEO_CHUNK_SIZE) as fh:
+                        # media_upload detects the MIME type INIT needs and forwards
+                        # chunk_size to chunked_upload
+                        response = api.media_upload(
+                            media_file,
+                            file=fh,
+                            media_category="tweet_video",
+                            chunk_size=_VIDEO_CHUNK_SIZE,
+                        )
+                else:
+                    response = api.media_upload(media_file)
             except tweepy.TweepyException as e:
                 raise RuntimeError(f"Failed to upload media {media_file}: {e}")
+            return str(response.media_id)
+
+        # Upload media files in parallel (map keeps media_ids in input order)
+        with ThreadPoolExecutor(max_workers=min(4, len(validated)) or 1) as executor:
+            media_ids = list(executor.map(upload, validated))
 
         # Post tweet with media
         try:
@@ -139,5 +190,6 @@ def post_tweet_with_media(text: str, media_files: list) -> dict:
 def clear_media_credentials() -> None:
     """Clear saved media credentials"""
     creds_path = get_media_credentials_path()
+    _CREDS_CACHE["key"] = None
     if creds_path.exists():
         creds_path.unlink()
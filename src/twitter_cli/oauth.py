@@ -4,13 +4,26 @@ import hashlib
 import secrets
 import base64
 import urllib.parse
-import webbrowser
-import json
-from http.server import HTTPServer, BaseHTTPRequestHandler
-from threading import Thread
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from threading import Event, Thread
 from typing import Tuple
 import requests
 
+from .session import SESSION
+
+
+# Query parameters that are the same for every authorization URL, encoded once
+_STATIC_AUTH_QUERY = urllib.parse.urlencode({
+    "response_type": "code",
+    "scope": "tweet.read tweet.write users.read offline.access",
+    "code_challenge_method": "S256",
+})
+
+
+def _b64url(data: bytes) -> bytes:
+    """Unpadded base64url encoding, kept as bytes"""
+    return base64.urlsafe_b64encode(data).rstrip(b"=")
+
 
 def generate_pkce_pair() -> Tuple[str, str]:
     """
@@ -22,20 +35,16 @@ def generate_pkce_pair() -> Tuple[str, str]:
 
     Returns: (code_verifier, code_challenge)
     """
-    code_verifier = base64.urlsafe_b64encode(secrets.token_bytes(32)).decode("utf-8")
-    code_verifier = code_verifier.rstrip("=")  # Remove padding
+    # Hash the verifier bytes directly instead of re-encoding the str
+    verifier_bytes = _b64url(secrets.token_bytes(32))  # 43 chars
+    code_challenge = _b64url(hashlib.sha256(verifier_bytes).digest())
 
-    code_challenge = base64.urlsafe_b64encode(
-        hashlib.sha256(code_verifier.encode("utf-8")).digest()
-    ).decode("utf-8")
-    code_challenge = code_challenge.rstrip("=")  # Remove padding
-
-    return code_verifier, code_challenge
+    return verifier_bytes.decode("ascii"), code_challenge.decode("ascii")
 
 
 def generate_state() -> str:
     """Generate random state for CSRF protection"""
-    return base64.urlsafe_b64encode(secrets.token_bytes(32)).decode("utf-8").rstrip("=")
+    return secrets.token_urlsafe(32)
 
 
 def build_auth_url(
@@ -46,17 +55,14 @@ def build_auth_url(
 
     Base: https://x.com/i/oauth2/authorize
     """
-    params = {
-        "response_type": "code",
+    params = urllib.parse.urlencode({
         "client_id": client_id,
         "redirect_uri": redirect_uri,
-        "scope": "tweet.read tweet.write users.read offline.access",
         "state": state,
         "code_challenge": code_challenge,
-        "code_challenge_method": "S256",
-    }
+    })
 
-    return f"https://x.com/i/oauth2/authorize?{urllib.parse.urlencode(params)}"
+    return f"https://x.com/i/oauth2/authorize?{_STATIC_AUTH_QUERY}&{params}"
 
 
 class CallbackHandler(BaseHTTPRequestHandler):
@@ -69,12 +75,21 @@ class CallbackHandler(BaseHTTPRequestHandler):
         """Handle GET request to /callback"""
         parsed_path = urllib.parse.urlparse(self.path)
 
+        # Ignore favicon and other stray requests, keep waiting for the callback
         if parsed_path.path != "/callback":
             self.send_response(404)
             self.end_headers()
             self.wfile.write(b"Not found")
             return
 
+        try:
+            self._handle_callback(parsed_path)
+        finally:
+            # Wake up start_callback_server once the response has been sent
+            self.server.done.set()
+
+    def _handle_callback(self, parsed_path):
+        """Store the authorization code (or error) from the /callback request"""
         query_params = urllib.parse.parse_qs(parsed_path.query)
 
         # Check for errors from X
@@ -154,16 +169,23 @@ def start_callback_server(expected_state: str) -> str:
 
     Returns: authorization_code (string) or raises exception
     """
+    CallbackHandler.authorization_code = None
+    CallbackHandler.error_message = None
+
     server_address = ("localhost", 8085)
-    server = HTTPServer(server_address, CallbackHandler)
+    server = ThreadingHTTPServer(server_address, CallbackHandler)
     server.expected_state = expected_state
+    server.done = Event()
 
     # Run server in background thread
-    server_thread = Thread(target=server.handle_request, daemon=True)
-    server_thread.start()
+    Thread(target=server.serve_forever, daemon=True).start()
 
-    # Wait for callback (with timeout)
-    server_thread.join(timeout=300)  # 5 minute timeout
+    # Wait for callback (with timeout), returning as soon as it arrives
+    try:
+        server.done.wait(timeout=300)  # 5 minute timeout
+    finally:
+        server.shutdown()
+        server.server_close()
 
     if CallbackHandler.error_message:
         raise RuntimeError(f"OAuth error: {CallbackHandler.error_message}")
@@ -180,6 +202,7 @@ def exchange_code_for_tokens(
     client_id: str,
     client_secret: str,
     redirect_uri: str,
+    session: requests.Session = SESSION,
 ) -> dict:
     """
     Exchange authorization code for access/refresh tokens.
@@ -197,7 +220,7 @@ def exchange_code_for_tokens(
     }
 
     try:
-        response = requests.post(
+        response = session.post(
             "https://api.x.com/2/oauth2/token",
             auth=auth,
             data=data,
@@ -213,12 +236,12 @@ def exchange_code_for_tokens(
         raise RuntimeError(f"Invalid token response: {e}")
 
 
-def get_user_info(access_token: str) -> dict:
+def get_user_info(access_token: str, session: requests.Session = SESSION) -> dict:
     """Get authenticated user info from X API"""
     headers = {"Authorization": f"Bearer {access_token}"}
 
     try:
-        response = requests.get(
+        response = session.get(
             "https://api.x.com/2/users/me",
             headers=headers,
             timeout=10,
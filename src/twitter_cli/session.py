@@ -0,0 +1,52 @@
+"""Shared HTTP session for all X API calls"""
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+
+# One pooled keep-alive session for api.x.com, upload.x.com and token endpoints
+SESSION = requests.Session()
+SESSION.headers.update({"User-Agent": "twitter-cli", "Accept": "application/json"})
+
+# Retry rate limits and transient 5xx with exponential backoff, honoring Retry-After.
+# Uploads stream their body from disk and can't be replayed, so POSTs are only
+# retried against api.x.com, and there only on 429: after a 5xx X may already have
+# created the tweet or consumed the one-time auth code / rotated refresh token.
+_RETRY_STATUSES = [429, 500, 502, 503, 504]
+
+
+class _RateLimitPostRetry(Retry):
+    """Retry that also replays POSTs, but only when they were rate limited (429)"""
+
+    def is_retry(self, method: str, status_code: int, has_retry_after: bool = False) -> bool:
+        if method.upper() == "POST":
+            return status_code == 429
+        return super().is_retry(method, status_code, has_retry_after)
+
+
+def _retry(methods: frozenset, retry_cls: type = Retry) -> Retry:
+    return retry_cls(
+        total=3,
+        backoff_factor=0.5,
+        status_forcelist=_RETRY_STATUSES,
+        allowed_methods=methods,
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    )
+
+
+SESSION.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=8))
+SESSION.mount(
+    "https://api.x.com",
+    HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=_retry(frozenset(["GET", "HEAD"]), _RateLimitPostRetry)),
+)
+SESSION.mount(
+    "https://upload.x.com",
+    HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=_retry(frozenset(["GET", "HEAD"]))),
+)
+
+
+def close() -> None:
+    """Close the shared HTTP session and its pooled connections"""
+    SESSION.close()
@@ -1,14 +1,16 @@
 """Token and config management for Twitter OAuth 2.0"""
 
-import json
 import os
 from pathlib import Path
-from datetime import datetime, timedelta
+from datetime import datetime
 import time
 import hashlib
-import base64
+import threading
+import orjson
 import requests
 
+from .session import SESSION
+
 
 # Config directory location:
 # - macOS/Linux: ~/.twitter_cli/
@@ -16,46 +18,103 @@ import requests
 CONFIG_DIR = Path.home() / ".twitter_cli"
 CONFIG_FILE = CONFIG_DIR / "config.json"
 TOKENS_FILE = CONFIG_DIR / "tokens.json"
+USERINFO_FILE = CONFIG_DIR / "userinfo.json"
+
+# How long a cached /users/me lookup stays valid
+USERINFO_TTL = 24 * 60 * 60
+
+# In-process cache of the current access token, so repeated calls skip disk reads
+_TOKEN_CACHE = {"value": None, "expires_at": 0.0}
+_TOKEN_CACHE_LOCK = threading.Lock()
+
+# Serializes refresh_access_token so concurrent callers share one refresh
+_REFRESH_LOCK = threading.Lock()
+
+# Set once CONFIG_DIR is known to exist, so saves skip the mkdir
+_DIR_READY = False
+
+# Parsed config/tokens files, keyed by path and validated against (mtime_ns, size)
+_FILE_CACHE: dict[Path, tuple[tuple[int, int], dict]] = {}
+
+
+class NotAuthenticated(RuntimeError):
+    """Raised when no tokens or client credentials are stored"""
+
+
+def _invalidate_token_cache() -> None:
+    """Drop the cached access token"""
+    with _TOKEN_CACHE_LOCK:
+        _TOKEN_CACHE["value"] = None
+        _TOKEN_CACHE["expires_at"] = 0.0
+
+
+def _load_json_file(path: Path, name: str) -> dict | None:
+    """Load a JSON file, reusing the parsed dict while the file is unchanged"""
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        _FILE_CACHE.pop(path, None)
+        return None
+
+    key = (st.st_mtime_ns, st.st_size)
+    cached = _FILE_CACHE.get(path)
+    if cached is not None and cached[0] == key:
+        return dict(cached[1])
+
+    try:
+        with open(path, "rb") as f:
+            data = orjson.loads(f.read())
+    except (orjson.JSONDecodeError, IOError) as e:
+        raise RuntimeError(f"Failed to read {name}: {e}")
+
+    _FILE_CACHE[path] = (key, data)
+    return dict(data)
 
 
 def ensure_config_dir():
     """Create config directory if it doesn't exist"""
+    global _DIR_READY
+    if _DIR_READY:
+        return
     CONFIG_DIR.mkdir(mode=0o700, parents=True, exist_ok=True)
+    _DIR_READY = True
 
 
-def save_config(client_id: str, client_secret: str) -> None:
-    """Save client credentials to ~/.twitter_cli/config.json with secure permissions"""
+def _atomic_write_json(path: Path, obj: dict) -> None:
+    """Atomically write obj as JSON to path, readable only by the owner"""
     ensure_config_dir()
-    config = {"client_id": client_id, "client_secret": client_secret}
 
-    # Write to temporary file first
-    temp_file = CONFIG_FILE.with_suffix(".tmp")
-    with open(temp_file, "w") as f:
-        json.dump(config, f)
+    # Write to temporary file first, with owner-only permissions. The mode given to
+    # os.open only applies on creation, so also tighten a leftover temp file.
+    temp_file = path.with_suffix(".tmp")
+    fd = os.open(temp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    os.fchmod(fd, 0o600)
+    with os.fdopen(fd, "wb") as f:
+        f.write(orjson.dumps(obj))
+
+    os.replace(temp_file, path)
+    _FILE_CACHE.pop(path, None)
+
 
-    # Set permissions before moving (only owner can read/write)
-    os.chmod(temp_file, 0o600)
-    temp_file.replace(CONFIG_FILE)
+def save_config(client_id: str, client_secret: str) -> None:
+    """Save client credentials to ~/.twitter_cli/config.json with secure permissions"""
+    config = {"client_id": client_id, "client_secret": client_secret}
+    _atomic_write_json(CONFIG_FILE, config)
 
 
 def load_config() -> dict | None:
     """Load config from ~/.twitter_cli/config.json"""
-    if not CONFIG_FILE.exists():
-        return None
-
-    try:
-        with open(CONFIG_FILE, "r") as f:
-            return json.load(f)
-    except (json.JSONDecodeError, IOError) as e:
-        raise RuntimeError(f"Failed to read config: {e}")
+    return _load_json_file(CONFIG_FILE, "config")
 
 
 def save_tokens(
-    access_token: str, refresh_token: str, expires_in: int, scope: str
+    access_token: str,
+    refresh_token: str,
+    expires_in: int,
+    scope: str,
+    username: str | None = None,
 ) -> None:
     """Save tokens to ~/.twitter_cli/tokens.json with secure permissions"""
-    ensure_config_dir()
-
     expires_at = int(time.time()) + expires_in
     tokens = {
         "access_token": access_token,
@@ -63,27 +122,21 @@ def save_tokens(
         "expires_at": expires_at,
         "scope": scope,
     }
+    if username:
+        tokens["username"] = username
+
+    _write_tokens(tokens)
+    _invalidate_token_cache()
 
-    # Write to temporary file first
-    temp_file = TOKENS_FILE.with_suffix(".tmp")
-    with open(temp_file, "w") as f:
-        json.dump(tokens, f)
 
-    # Set permissions before moving (only owner can read/write)
-    os.chmod(temp_file, 0o600)
-    temp_file.replace(TOKENS_FILE)
+def _write_tokens(tokens: dict) -> None:
+    """Atomically write the tokens dict to ~/.twitter_cli/tokens.json"""
+    _atomic_write_json(TOKENS_FILE, tokens)
 
 
 def load_tokens() -> dict | None:
     """Load tokens from ~/.twitter_cli/tokens.json"""
-    if not TOKENS_FILE.exists():
-        return None
-
-    try:
-        with open(TOKENS_FILE, "r") as f:
-            return json.load(f)
-    except (json.JSONDecodeError, IOError) as e:
-        raise RuntimeError(f"Failed to read tokens: {e}")
+    return _load_json_file(TOKENS_FILE, "tokens")
 
 
 def is_token_expired(expires_at: int) -> bool:
@@ -93,27 +146,69 @@ def is_token_expired(expires_at: int) -> bool:
 
 def get_valid_access_token() -> str:
     """Get a valid access token, refreshing if necessary"""
+    with _TOKEN_CACHE_LOCK:
+        if _TOKEN_CACHE["expires_at"] - time.time() > 60:
+            return _TOKEN_CACHE["value"]
+
+    access_token, _ = get_valid_access_token_or_none()
+    return access_token
+
+
+def get_valid_access_token_or_none() -> tuple[str, dict]:
+    """
+    Get a valid access token and the stored tokens with a single tokens.json read.
+
+    Returns:
+        Tuple of (access_token, tokens dict)
+
+    Raises:
+        NotAuthenticated: If no tokens are stored
+        RuntimeError: If refreshing an expired token fails
+    """
     tokens = load_tokens()
 
     if tokens is None:
-        raise RuntimeError(
+        raise NotAuthenticated(
             "Not authenticated. Run 'twitter-cli auth' first."
         )
 
-    if not is_token_expired(tokens["expires_at"]):
-        return tokens["access_token"]
+    if is_token_expired(tokens["expires_at"]):
+        # Token expired, refresh it (config.json is only read on this path)
+        refresh_access_token(tokens)
+        tokens = load_tokens()
 
-    # Token expired, refresh it
-    return refresh_access_token()
+    with _TOKEN_CACHE_LOCK:
+        _TOKEN_CACHE["value"] = tokens["access_token"]
+        _TOKEN_CACHE["expires_at"] = float(tokens["expires_at"])
+    return tokens["access_token"], tokens
 
 
-def refresh_access_token() -> str:
-    """Refresh access token using refresh token"""
-    tokens = load_tokens()
+def refresh_access_token(
+    tokens: dict | None = None, session: requests.Session = SESSION
+) -> str:
+    """
+    Refresh access token using refresh token (pass tokens if already loaded).
+
+    Only one refresh runs at a time; callers that were waiting on it get the
+    token it saved instead of spending the refresh token again.
+    """
+    if tokens is None:
+        tokens = load_tokens()
+
+    with _REFRESH_LOCK:
+        current = load_tokens()
+        # Another thread refreshed while this one waited for the lock
+        if tokens and current and current["access_token"] != tokens["access_token"]:
+            return current["access_token"]
+        return _refresh(current, session)
+
+
+def _refresh(tokens: dict | None, session: requests.Session) -> str:
+    """POST the refresh token and save the new tokens (caller holds _REFRESH_LOCK)"""
     config = load_config()
 
     if tokens is None or config is None:
-        raise RuntimeError(
+        raise NotAuthenticated(
             "Not authenticated. Run 'twitter-cli auth' first."
         )
 
@@ -130,7 +225,7 @@ def refresh_access_token() -> str:
     }
 
     try:
-        response = requests.post(
+        response = session.post(
             "https://api.x.com/2/oauth2/token",
             auth=auth,
             data=data,
@@ -145,19 +240,108 @@ def refresh_access_token() -> str:
     except ValueError as e:
         raise RuntimeError(f"Invalid token response: {e}")
 
-    # Save new tokens
+    # Save new tokens (the user info cache is keyed on the old access token)
+    clear_userinfo_cache()
     save_tokens(
         token_data["access_token"],
         token_data.get("refresh_token", refresh_token),  # Use old if not provided
         token_data["expires_in"],
         token_data.get("scope", tokens["scope"]),
+        username=tokens.get("username"),
     )
 
     return token_data["access_token"]
 
 
+def refresh_if_near_expiry(
+    threshold_seconds: int = 300, tokens: dict | None = None
+) -> threading.Thread | None:
+    """
+    Refresh the access token in the background if it expires soon.
+
+    Returns the refresh thread (so callers can join it before they need the
+    token), or None if no refresh was needed. Pass tokens if they're already
+    loaded to skip re-reading tokens.json.
+    """
+    if tokens is None:
+        tokens = load_tokens()
+    if tokens is None or tokens["expires_at"] - time.time() >= threshold_seconds:
+        return None
+
+    thread = threading.Thread(target=_refresh_quietly, daemon=True)
+    thread.start()
+    return thread
+
+
+def _refresh_quietly() -> None:
+    """Refresh the access token, leaving failures to the next foreground call"""
+    try:
+        refresh_access_token()
+    except RuntimeError:
+        pass
+
+
+def save_username(username: str) -> None:
+    """Cache the authenticated username alongside the stored tokens"""
+    tokens = load_tokens()
+    if tokens is None:
+        return
+    tokens["username"] = username
+    _write_tokens(tokens)
+
+
+def get_username() -> str | None:
+    """Get the username cached in tokens.json, if any"""
+    tokens = load_tokens()
+    if tokens is None:
+        return None
+    return tokens.get("username")
+
+
+def _token_digest(access_token: str) -> str:
+    """Short fingerprint of an access token, so the token itself isn't stored twice"""
+    return hashlib.sha256(access_token.encode()).hexdigest()[:16]
+
+
+def load_cached_userinfo(access_token: str) -> str | None:
+    """Get the username cached for this access token, if fresh (< USERINFO_TTL)"""
+    if not USERINFO_FILE.exists():
+        return None
+
+    try:
+        with open(USERINFO_FILE, "rb") as f:
+            cached = orjson.loads(f.read())
+    except (orjson.JSONDecodeError, IOError):
+        return None
+
+    if cached.get("token_sha256") != _token_digest(access_token):
+        return None
+    if time.time() - cached.get("cached_at", 0) >= USERINFO_TTL:
+        return None
+    return cached.get("username")
+
+
+def save_cached_userinfo(access_token: str, username: str) -> None:
+    """Cache the username for this access token in ~/.twitter_cli/userinfo.json"""
+    cached = {
+        "token_sha256": _token_digest(access_token),
+        "username": username,
+        "cached_at": int(time.time()),
+    }
+    _atomic_write_json(USERINFO_FILE, cached)
+
+
+def clear_userinfo_cache() -> None:
+    """Delete userinfo.json file"""
+    if USERINFO_FILE.exists():
+        USERINFO_FILE.unlink()
+
+
 def clear_tokens() -> None:
     """Delete tokens.json file (for logout)"""
+    _invalidate_token_cache()
+    clear_userinfo_cache()
+    _FILE_CACHE.pop(TOKENS_FILE, None)
     if TOKENS_FILE.exists():
         TOKENS_FILE.unlink()
 
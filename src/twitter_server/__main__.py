@@ -1,29 +1,63 @@
 """Run the Twitter OAuth2.0 server as a module"""
 
-import sys
-from .server import run_server
+import argparse
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    """Parse [host] [port] plus --localhost/--host and --workers"""
+    parser = argparse.ArgumentParser(
+        prog="python -m twitter_server",
+        description="Run the Twitter OAuth2.0 server",
+    )
+    parser.add_argument(
+        "address",
+        nargs="*",
+        metavar="[HOST] [PORT]",
+        help="optional host and/or port, e.g. '9000' or '192.168.1.100 8000'",
+    )
+    bind = parser.add_mutually_exclusive_group()
+    bind.add_argument(
+        "--localhost",
+        action="store_const",
+        const="127.0.0.1",
+        dest="host",
+        help="restrict to localhost only",
+    )
+    bind.add_argument("--host", help="interface to bind (default: 0.0.0.0)")
+    parser.add_argument("--port", type=int, help="port to listen on (default: 8000)")
+    parser.add_argument(
+        "--workers", type=int, help="worker processes (default: $WEB_CONCURRENCY, else 1)"
+    )
+    args = parser.parse_args(argv)
+
+    # Positional form: [port] or [host] [port]
+    address = list(args.address)
+    if len(address) > 2:
+        parser.error("expected at most [HOST] [PORT]")
+    if address and not address[-1].isdigit():
+        if len(address) > 1:
+            parser.error(f"invalid port: {address[-1]}")
+        address.append(None)
+    if len(address) == 2:
+        if args.host is not None:
+            parser.error("give the host either positionally or with --host/--localhost")
+        args.host = address.pop(0)
+    if address and address[0] is not None:
+        if args.port is not None:
+            parser.error("give the port either positionally or with --port")
+        args.port = int(address[0])
 
-if __name__ == "__main__":
     # Default: bind to 0.0.0.0 so it's accessible from any machine on the network
-    host = "0.0.0.0"
-    port = 8000
-
-    # Parse command line arguments
-    args = sys.argv[1:]
-
-    # Check for --localhost flag to restrict to localhost only
-    if "--localhost" in args:
-        host = "127.0.0.1"
-        args.remove("--localhost")
-
-    # Parse remaining arguments as [host] [port]
-    if len(args) > 0:
-        try:
-            port = int(args[0])
-        except ValueError:
-            host = args[0]
-            if len(args) > 1:
-                port = int(args[1])
+    if args.host is None:
+        args.host = "0.0.0.0"
+    if args.port is None:
+        args.port = 8000
+    return args
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    host, port = args.host, args.port
 
     print(f"Starting Twitter OAuth2.0 Server on {host}:{port}")
     if host == "0.0.0.0":
@@ -34,7 +68,10 @@ if __name__ == "__main__":
     print(f"Root endpoint: http://127.0.0.1:{port}/ (if on this machine)")
     print("\nPress Ctrl+C to stop the server\n")
 
+    # Imported only now so --help and argument errors don't load FastAPI/pydantic
+    from .server import run_server
+
     try:
-        run_server(host=host, port=port)
+        run_server(host=host, port=port, workers=args.workers)
     except KeyboardInterrupt:
         print("\nServer stopped.")
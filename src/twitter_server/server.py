@@ -1,10 +1,14 @@
 """FastAPI server for posting tweets via HTTP requests"""
 
+import asyncio
+from contextlib import asynccontextmanager
 from fastapi import FastAPI, HTTPException
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from typing import Optional, List
 import sys
 import os
+import time
+from datetime import datetime
 
 # Add parent directory to path to import twitter_cli modules
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
@@ -12,10 +16,18 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
 from twitter_cli import token_manager, api, media_manager
 
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Close the shared async X API client on shutdown"""
+    yield
+    await api.aclose()
+
+
 app = FastAPI(
     title="Twitter OAuth2.0 Server",
     description="HTTP server for posting tweets using OAuth 2.0",
     version="0.1.0",
+    lifespan=lifespan,
 )
 
 
@@ -24,108 +36,204 @@ class TweetRequest(BaseModel):
     text: str
 
 
+class TweetBatchRequest(BaseModel):
+    """Request model for posting several text tweets in one call"""
+    tweets: List[TweetRequest] = Field(min_length=1, max_length=100)
+
+
 class TweetWithMediaRequest(BaseModel):
     """Request model for posting a tweet with media"""
     text: str
     media_paths: List[str]
 
 
+# Response models: with a return type set, FastAPI serializes straight to JSON bytes
+# through Pydantic instead of going via jsonable_encoder and the stdlib encoder
+
+
+class StatusResponse(BaseModel):
+    """Response model for authentication status"""
+    authenticated: bool
+    username: str
+    token_expires_at: str
+    scopes: List[str]
+
+
+class TweetResponse(BaseModel):
+    """Response model for a posted tweet"""
+    success: bool
+    tweet_id: Optional[str]
+    text: str
+
+
+class TweetWithMediaResponse(TweetResponse):
+    """Response model for a posted tweet with media"""
+    media_count: int
+
+
+class TweetBatchResult(BaseModel):
+    """Outcome of one tweet in a batch (tweet_id on success, error on failure)"""
+    success: bool
+    text: str
+    tweet_id: Optional[str] = None
+    error: Optional[str] = None
+
+
+class TweetBatchResponse(BaseModel):
+    """Response model for a batch of tweets"""
+    results: List[TweetBatchResult]
+
+
+class _TokenCache:
+    """Access token and stored tokens shared by all requests in this worker"""
+
+    def __init__(self):
+        self.lock = asyncio.Lock()
+        self.access_token: Optional[str] = None
+        self.tokens: Optional[dict] = None
+        self.mtime_ns: Optional[int] = None
+
+    def is_fresh(self) -> bool:
+        """Valid for 60+ more seconds and tokens.json hasn't changed since it was loaded"""
+        if self.tokens is None or time.time() + 60 > self.tokens["expires_at"]:
+            return False
+        try:
+            return os.stat(token_manager.TOKENS_FILE).st_mtime_ns == self.mtime_ns
+        except FileNotFoundError:
+            return False
+
+
+_TOKENS = _TokenCache()
+
+
+async def _get_tokens() -> tuple[str, dict]:
+    """Get a valid access token and the stored tokens without blocking the event loop"""
+    if _TOKENS.is_fresh():
+        return _TOKENS.access_token, _TOKENS.tokens
+
+    async with _TOKENS.lock:
+        # Another request may have reloaded (or refreshed) while we waited
+        if not _TOKENS.is_fresh():
+            try:
+                # May hit disk or the refresh endpoint, so run it in a worker thread
+                access_token, tokens = await asyncio.to_thread(
+                    token_manager.get_valid_access_token_or_none
+                )
+                mtime_ns = os.stat(token_manager.TOKENS_FILE).st_mtime_ns
+            except token_manager.NotAuthenticated:
+                raise HTTPException(status_code=401, detail="Not authenticated. Run 'twitter-cli auth' first.")
+            except Exception as e:
+                raise HTTPException(status_code=401, detail=f"Authentication error: {str(e)}")
+
+            _TOKENS.access_token, _TOKENS.tokens, _TOKENS.mtime_ns = access_token, tokens, mtime_ns
+
+        return _TOKENS.access_token, _TOKENS.tokens
+
+
 @app.get("/health")
-def health_check():
+def health_check() -> dict:
     """Health check endpoint"""
     return {"status": "healthy"}
 
 
 @app.get("/status")
-def status():
+async def status() -> StatusResponse:
     """Get server status and authentication info"""
-    if not token_manager.is_authenticated():
-        raise HTTPException(status_code=401, detail="Not authenticated")
-
-    tokens = token_manager.load_tokens()
-    config = token_manager.load_config()
+    access_token, tokens = await _get_tokens()
 
-    if not tokens or not config:
-        raise HTTPException(status_code=401, detail="Not authenticated")
-
-    try:
-        access_token = token_manager.get_valid_access_token()
-    except Exception as e:
-        raise HTTPException(status_code=401, detail=f"Token error: {str(e)}")
-
-    try:
-        from twitter_cli import oauth
-        user_info = oauth.get_user_info(access_token)
-        username = user_info.get("username", "unknown")
-    except Exception as e:
-        username = "unknown"
+    # Prefer the username cached in tokens.json over a /users/me round-trip
+    username = tokens.get("username")
+    if not username:
+        try:
+            user_info = await api.aget_user_info(access_token)
+            username = user_info.get("username", "unknown")
+        except Exception as e:
+            username = "unknown"
 
-    expiration = token_manager.get_token_expiration_time()
+    expiration = datetime.fromtimestamp(tokens["expires_at"])
 
-    return {
-        "authenticated": True,
-        "username": username,
-        "token_expires_at": expiration.isoformat() if expiration else None,
-        "scopes": tokens.get("scope", "").split() if tokens.get("scope") else [],
-    }
+    return StatusResponse(
+        authenticated=True,
+        username=username,
+        token_expires_at=expiration.isoformat(),
+        scopes=tokens.get("scope", "").split() if tokens.get("scope") else [],
+    )
 
 
 @app.post("/tweet")
-def post_tweet(request: TweetRequest):
+async def post_tweet(request: TweetRequest) -> TweetResponse:
     """Post a text-only tweet"""
-    if not token_manager.is_authenticated():
-        raise HTTPException(status_code=401, detail="Not authenticated. Run 'twitter-cli auth' first.")
+    access_token, _ = await _get_tokens()
 
     try:
-        access_token = token_manager.get_valid_access_token()
-    except Exception as e:
-        raise HTTPException(status_code=401, detail=f"Authentication error: {str(e)}")
-
-    try:
-        result = api.post_tweet(request.text, access_token)
-        return {
-            "success": True,
-            "tweet_id": result.get("id"),
-            "text": request.text,
-        }
+        result = await api.apost_tweet(request.text, access_token)
+        return TweetResponse(success=True, tweet_id=result.get("id"), text=request.text)
     except Exception as e:
         raise HTTPException(status_code=400, detail=f"Failed to post tweet: {str(e)}")
 
 
+# exclude_unset keeps each result to the fields that apply (no null error on success)
+@app.post("/tweets:batch", response_model_exclude_unset=True)
+async def post_tweets_batch(request: TweetBatchRequest) -> TweetBatchResponse:
+    """Post several text-only tweets concurrently, reporting success per tweet"""
+    access_token, _ = await _get_tokens()
+
+    results = await asyncio.gather(
+        *(api.apost_tweet(tweet.text, access_token) for tweet in request.tweets),
+        return_exceptions=True,
+    )
+
+    return TweetBatchResponse(
+        results=[
+            TweetBatchResult(success=False, text=tweet.text, error=str(result))
+            if isinstance(result, Exception)
+            else TweetBatchResult(success=True, tweet_id=result.get("id"), text=tweet.text)
+            for tweet, result in zip(request.tweets, results)
+        ]
+    )
+
+
 @app.post("/tweet-media")
-def post_tweet_with_media(request: TweetWithMediaRequest):
+async def post_tweet_with_media(request: TweetWithMediaRequest) -> TweetWithMediaResponse:
     """Post a tweet with media (images or videos)"""
-    if not token_manager.is_authenticated():
-        raise HTTPException(status_code=401, detail="Not authenticated. Run 'twitter-cli auth' first.")
+    await _get_tokens()
 
-    # Check if media credentials are available
-    if not media_manager.has_media_credentials():
+    # Check media credentials and validate all media paths in one thread hop,
+    # reporting every missing file at once
+    def check_media() -> tuple[bool, list]:
+        missing = [path for path in request.media_paths if not os.path.exists(path)]
+        return media_manager.has_media_credentials(), missing
+
+    has_credentials, missing = await asyncio.to_thread(check_media)
+    if not has_credentials:
         raise HTTPException(
             status_code=400,
             detail="Media credentials not configured. Run 'twitter-cli auth-media' first."
         )
+    if missing:
+        raise HTTPException(
+            status_code=400,
+            detail={"message": "Media file not found", "missing": missing},
+        )
 
     try:
-        # Validate media paths exist
-        for path in request.media_paths:
-            if not os.path.exists(path):
-                raise HTTPException(status_code=400, detail=f"Media file not found: {path}")
-
-        # Use OAuth 1.0a media posting (via tweepy)
-        result = media_manager.post_tweet_with_media(request.text, request.media_paths)
-
-        return {
-            "success": True,
-            "tweet_id": result.get("id"),
-            "text": request.text,
-            "media_count": len(request.media_paths),
-        }
+        # Use OAuth 1.0a media posting (via tweepy), off the event loop
+        result = await asyncio.to_thread(
+            media_manager.post_tweet_with_media, request.text, request.media_paths
+        )
+
+        return TweetWithMediaResponse(
+            success=True,
+            tweet_id=result.get("id"),
+            text=request.text,
+            media_count=len(request.media_paths),
+        )
     except Exception as e:
         raise HTTPException(status_code=400, detail=f"Failed to post tweet with media: {str(e)}")
 
 
 @app.get("/")
-def root():
+def root() -> dict:
     """Root endpoint with API documentation"""
     return {
         "name": "Twitter OAuth2.0 Server",
@@ -135,12 +243,26 @@ def root():
             "GET /health": "Health check",
             "GET /status": "Get authentication status and user info",
             "POST /tweet": "Post a text-only tweet",
+            "POST /tweets:batch": "Post up to 100 text-only tweets concurrently",
             "POST /tweet-media": "Post a tweet with media",
         }
     }
 
 
-def run_server(host: str = "127.0.0.1", port: int = 8000):
-    """Run the server"""
+def run_server(host: str = "127.0.0.1", port: int = 8000, workers: Optional[int] = None):
+    """Run the server (worker count defaults to $WEB_CONCURRENCY, else 1)"""
     import uvicorn
-    uvicorn.run(app, host=host, port=port)
+
+    if workers is None:
+        workers = int(os.getenv("WEB_CONCURRENCY", "1"))
+
+    uvicorn.run(
+        # Multiple worker processes need an import string instead of the app object
+        "twitter_server.server:app" if workers > 1 else app,
+        host=host,
+        port=port,
+        workers=workers,
+        loop="auto",  # uvloop when installed
+        http="auto",  # httptools when installed
+        access_log=False,
+    )
@@ -1,9 +1,9 @@
 """Chunk documentation into logical sections"""
-import json
+import orjson
 from typing import List, Dict
 import re
 
-def chunk_text(text: str, chunk_size: int = 500, overlap: int = 100) -> List[str]:
+def chunk_text(text: str, chunk_size: int = 500, overlap: int = 100, separator: str = "\n\n") -> List[str]:
     """
     Split text into chunks with overlap
 
@@ -11,23 +11,45 @@ def chunk_text(text: str, chunk_size: int = 500, overlap: int = 100) -> List[str
         text: Text to chunk
         chunk_size: Target characters per chunk
         overlap: Characters to overlap between chunks
+        separator: Paragraph separator to split on and rejoin with
     """
     chunks = []
 
-    # Split by paragraphs first (separated by double newlines)
-    paragraphs = text.split('\n\n')
+    # Split by paragraphs first, cutting any paragraph longer than a chunk into
+    # pieces that still fit once the overlap tail is prepended
+    step = max(chunk_size - overlap, 1)
+    paragraphs = [
+        paragraph[i:i + step] if len(paragraph) > chunk_size else paragraph
+        for paragraph in text.split(separator)
+        for i in (range(0, len(paragraph), step) if len(paragraph) > chunk_size else (0,))
+    ]
+    sep_len = len(separator)
 
-    current_chunk = ""
+    # Collect parts and join once per chunk instead of growing a string.
+    # `fresh` is False while parts only hold the overlap carried from the last chunk.
+    parts = []
+    current_length = 0
+    fresh = False
     for paragraph in paragraphs:
-        if len(current_chunk) + len(paragraph) < chunk_size:
-            current_chunk += paragraph + "\n\n"
-        else:
-            if current_chunk:
-                chunks.append(current_chunk.strip())
-            current_chunk = paragraph + "\n\n"
+        if not paragraph.strip():
+            continue
 
-    if current_chunk:
-        chunks.append(current_chunk.strip())
+        if fresh and current_length + len(paragraph) >= chunk_size:
+            chunk = separator.join(parts).strip()
+            chunks.append(chunk)
+
+            # Start the next chunk with the last `overlap` characters of this one,
+            # unless the whole chunk would be carried over
+            tail = chunk[-overlap:] if 0 < overlap < len(chunk) else ""
+            parts = [tail] if tail else []
+            current_length = len(tail) + sep_len if tail else 0
+
+        parts.append(paragraph)
+        current_length += len(paragraph) + sep_len
+        fresh = True
+
+    if fresh:
+        chunks.append(separator.join(parts).strip())
 
     return chunks
 
@@ -44,8 +66,9 @@ def chunk_docs(docs: List[Dict[str, str]]) -> List[Dict[str, str]]:
         title = doc['title']
         content = doc['content']
 
-        # Chunk the content
-        chunks = chunk_text(content)
+        # fetch_docs writes one phrase per line, so lines are the paragraphs; chunks
+        # stay well under MiniLM's 256 word-piece input limit
+        chunks = chunk_text(content, separator="\n")
 
         for i, chunk in enumerate(chunks):
             all_chunks.append({
@@ -60,14 +83,14 @@ def chunk_docs(docs: List[Dict[str, str]]) -> List[Dict[str, str]]:
 
 def save_chunks(chunks: List[Dict[str, str]], output_file: str = "chunks.json"):
     """Save chunks to JSON"""
-    with open(output_file, 'w') as f:
-        json.dump(chunks, f, indent=2)
+    with open(output_file, 'wb') as f:
+        f.write(orjson.dumps(chunks, option=orjson.OPT_INDENT_2))
     print(f"Saved {len(chunks)} chunks to {output_file}")
     return chunks
 
 if __name__ == "__main__":
-    with open("docs.json", 'r') as f:
-        docs = json.load(f)
+    with open("docs.json", 'rb') as f:
+        docs = orjson.loads(f.read())
 
     chunks = chunk_docs(docs)
     save_chunks(chunks)
@@ -1,10 +1,10 @@
-"""Create embeddings and store in FAISS - using local gensim embeddings"""
-import json
+"""Create embeddings and store in FAISS - using a local int8 MiniLM sentence encoder"""
+import orjson
 import numpy as np
+import os
 from typing import List, Dict
 import pickle
-from gensim.models import KeyedVectors
-import gensim.downloader as api
+from sentence_transformers import SentenceTransformer
 
 try:
     import faiss
@@ -13,71 +13,73 @@ except ImportError:
     FAISS_AVAILABLE = False
     print("FAISS not installed. Install with: pip install faiss-cpu")
 
-# Use lightweight Word2Vec embeddings (no torch required)
+# all-MiniLM-L6-v2 run through ONNX Runtime using the int8 (dynamically quantized)
+# export published with the model; pick the file matching your CPU's instruction set
 MODEL = None
-EMBEDDING_DIM = 300
+EMBEDDING_MODEL_NAME = "sentence-transformers/all-MiniLM-L6-v2"
+EMBEDDING_ONNX_FILE = os.getenv("EMBEDDING_ONNX_FILE", "onnx/model_quint8_avx2.onnx")
+EMBEDDING_DIM = 384
+EMBEDDING_BATCH_SIZE = 64
 
-def load_embedding_model():
-    """Load gensim Word2Vec model"""
+# HNSW graph parameters: neighbors per node and build-time search breadth
+HNSW_M = 32
+HNSW_EF_CONSTRUCTION = 64
+
+def load_embedding_model() -> SentenceTransformer:
+    """Load the int8 MiniLM sentence encoder on ONNX Runtime"""
     global MODEL
     if MODEL is None:
-        print("Loading Word2Vec embedding model (this may take a moment on first run)...")
+        print("Loading MiniLM embedding model (downloads ~25MB on first run)...")
         try:
-            # Download and load pre-trained Word2Vec model
-            MODEL = api.load("word2vec-google-news-300")
-            print(f"Loaded Word2Vec model with {len(MODEL)} words, {EMBEDDING_DIM} dimensions")
+            MODEL = SentenceTransformer(
+                EMBEDDING_MODEL_NAME,
+                backend="onnx",
+                model_kwargs={"file_name": EMBEDDING_ONNX_FILE, "provider": "CPUExecutionProvider"},
+            )
+            print(f"Loaded {EMBEDDING_MODEL_NAME} ({EMBEDDING_ONNX_FILE}), {EMBEDDING_DIM} dimensions")
         except Exception as e:
             print(f"Error loading model: {e}")
             raise
     return MODEL
 
-def text_to_embedding(text: str, model) -> np.ndarray:
-    """Convert text to embedding by averaging word vectors"""
-    words = text.lower().split()
-    embeddings = []
-
-    for word in words:
-        try:
-            if word in model:
-                embeddings.append(model[word])
-        except KeyError:
-            pass
+def encode_texts(texts: List[str], model: SentenceTransformer) -> np.ndarray:
+    """Encode texts into an (N, EMBEDDING_DIM) float32 matrix of unit-length vectors"""
+    return model.encode(
+        texts,
+        batch_size=EMBEDDING_BATCH_SIZE,
+        convert_to_numpy=True,
+        normalize_embeddings=True,
+    ).astype('float32')
 
-    if embeddings:
-        return np.mean(embeddings, axis=0).astype('float32')
-    else:
-        # Return zero vector if no words found
-        return np.zeros(EMBEDDING_DIM, dtype='float32')
+def text_to_embedding(text: str, model: SentenceTransformer) -> np.ndarray:
+    """Convert text to a sentence embedding"""
+    return encode_texts([text], model)[0]
 
 def create_embeddings(chunks: List[Dict[str, str]]) -> np.ndarray:
-    """Create embeddings for all chunks"""
+    """Create embeddings for all chunks, encoding them in batches"""
     model = load_embedding_model()
-    texts = [chunk['content'] for chunk in chunks]
-    print(f"\nCreating embeddings for {len(texts)} chunks...")
+    print(f"\nCreating embeddings for {len(chunks)} chunks...")
 
-    embeddings = []
-    for i, text in enumerate(texts):
-        if (i + 1) % 10 == 0:
-            print(f"  Embedded {i+1}/{len(texts)}...")
-        embedding = text_to_embedding(text, model)
-        embeddings.append(embedding)
+    embeddings = encode_texts([chunk['content'] for chunk in chunks], model)
 
     print(f"Created {len(embeddings)} embeddings")
-    return np.array(embeddings).astype('float32')
+    return embeddings
 
-def build_faiss_index(embeddings: np.ndarray) -> faiss.IndexFlatL2:
-    """Build FAISS index"""
+def build_faiss_index(embeddings: np.ndarray) -> "faiss.Index":
+    """Build FAISS HNSW index over L2-normalized embeddings (L2 ranking == cosine)"""
     if not FAISS_AVAILABLE:
         raise ImportError("FAISS not installed")
 
     print(f"\nBuilding FAISS index with {len(embeddings)} vectors of {embeddings.shape[1]} dimensions...")
-    index = faiss.IndexFlatL2(embeddings.shape[1])
+    faiss.normalize_L2(embeddings)
+    index = faiss.IndexHNSWFlat(embeddings.shape[1], HNSW_M)
+    index.hnsw.efConstruction = HNSW_EF_CONSTRUCTION
     index.add(embeddings)
     print(f"✓ FAISS index built")
     return index
 
 def save_index_and_metadata(
-    index: faiss.IndexFlatL2,
+    index: "faiss.Index",
     chunks: List[Dict[str, str]],
     index_path: str = "faiss_index.bin",
     metadata_path: str = "metadata.pkl"
@@ -94,8 +96,8 @@ def embed_and_store(chunks_file: str = "chunks.json"):
     """Main function to embed and store"""
     # Load chunks
     print(f"Loading chunks from {chunks_file}...")
-    with open(chunks_file, 'r') as f:
-        chunks = json.load(f)
+    with open(chunks_file, 'rb') as f:
+        chunks = orjson.loads(f.read())
     print(f"✓ Loaded {len(chunks)} chunks")
 
     # Create embeddings
@@ -5,7 +5,12 @@ from rag_query import RAGSystem
 
 def main():
     print("Loading RAG system...")
-    rag = RAGSystem()
+    try:
+        rag = RAGSystem()
+    except (ImportError, FileNotFoundError, ValueError) as e:
+        print(f"Error loading RAG system: {e}")
+        print("Make sure you've run fetch_docs.py, chunk_docs.py, and embed_and_store.py first")
+        return
 
     # Example questions
     questions = [
@@ -1,20 +1,30 @@
 """Fetch and parse documentation from URLs"""
-import requests
-from bs4 import BeautifulSoup
-import json
+import asyncio
+import os
+import re
+import httpx
+import lxml.html
+from lxml import etree
+import orjson
+from concurrent.futures import ProcessPoolExecutor
 from typing import List, Dict
-import time
+from urllib.parse import urlsplit
 
-def fetch_url(url: str) -> str:
+HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+}
+MAX_CONCURRENT_FETCHES = 16
+MIN_INTERVAL_PER_HOST = 0.5  # Seconds between request starts to the same host
+# A line break or a run of 2+ spaces, with the whitespace around it, separates phrases
+_WS_RE = re.compile(r"\s*(?:\r|\n|  )\s*")
+
+async def fetch_url(client: httpx.AsyncClient, url: str) -> str:
     """Fetch content from a URL"""
     if not url or url.strip() == "":
         return ""
 
     try:
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        }
-        response = requests.get(url, headers=headers, timeout=10)
+        response = await client.get(url)
         response.raise_for_status()
         return response.text
     except Exception as e:
@@ -24,21 +34,16 @@ def fetch_url(url: str) -> str:
 def extract_text_from_html(html: str) -> str:
     """Extract clean text from HTML"""
     try:
-        soup = BeautifulSoup(html, 'html.parser')
+        tree = lxml.html.fromstring(html)
 
-        # Remove script and style elements
-        for script in soup(["script", "style"]):
-            script.decompose()
+        # Remove script and style elements (keeping the text that follows them)
+        etree.strip_elements(tree, "script", "style", with_tail=False)
 
         # Get text
-        text = soup.get_text()
-
-        # Clean up whitespace
-        lines = (line.strip() for line in text.splitlines())
-        chunks = (phrase.strip() for line in lines for phrase in line.split("  "))
-        text = '\n'.join(chunk for chunk in chunks if chunk)
+        text = tree.text_content()
 
-        return text
+        # Clean up whitespace: one phrase per line, no blank lines
+        return _WS_RE.sub("\n", text).strip()
     except Exception as e:
         print(f"Error extracting text: {e}")
         return ""
@@ -48,31 +53,53 @@ def fetch_all_docs(doc_file: str) -> List[Dict[str, str]]:
     docs = []
 
     with open(doc_file, 'r') as f:
-        urls = [line.strip() for line in f.readlines() if line.strip() and line.strip().startswith('http')]
+        # dict.fromkeys drops repeated URLs while keeping file order
+        urls = list(dict.fromkeys(u for u in (line.strip() for line in f) if u.startswith('http')))
 
     print(f"Found {len(urls)} URLs to fetch")
 
-    for i, url in enumerate(urls):
-        print(f"Fetching {i+1}/{len(urls)}: {url}")
-        html = fetch_url(url)
-
-        if html:
-            text = extract_text_from_html(html)
-            if text:
-                docs.append({
-                    'url': url,
-                    'content': text,
-                    'title': url.split('/')[-1] or 'kubernetes-docs'
-                })
-
-        time.sleep(0.5)  # Be respectful with requests
+    for url, text in asyncio.run(_fetch_all(urls)):
+        if text:
+            docs.append({
+                'url': url,
+                'content': text,
+                'title': url.split('/')[-1] or 'kubernetes-docs'
+            })
 
     return docs
 
+async def _fetch_all(urls: List[str]) -> List[tuple]:
+    """Fetch and extract all URLs concurrently, returning (url, text) in input order"""
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_FETCHES)
+    next_slot: Dict[str, float] = {}
+    loop = asyncio.get_running_loop()
+
+    async def wait_for_host(url: str):
+        # Be respectful with requests: space out starts per host instead of a global sleep
+        host = urlsplit(url).netloc
+        now = loop.time()
+        slot = max(now, next_slot.get(host, now))
+        next_slot[host] = slot + MIN_INTERVAL_PER_HOST
+        await asyncio.sleep(slot - now)
+
+    async def worker(i: int, url: str, client: httpx.AsyncClient, pool: ProcessPoolExecutor) -> tuple:
+        async with semaphore:
+            await wait_for_host(url)
+            print(f"Fetching {i+1}/{len(urls)}: {url}")
+            html = await fetch_url(client, url)
+        if not html:
+            return url, ""
+        # HTML parsing is CPU-bound, so run it in another process while fetches continue
+        return url, await loop.run_in_executor(pool, extract_text_from_html, html)
+
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as pool:
+        async with httpx.AsyncClient(http2=True, timeout=10, headers=HEADERS, follow_redirects=True) as client:
+            return await asyncio.gather(*(worker(i, url, client, pool) for i, url in enumerate(urls)))
+
 def save_docs(docs: List[Dict[str, str]], output_file: str = "docs.json"):
     """Save fetched docs to JSON"""
-    with open(output_file, 'w') as f:
-        json.dump(docs, f, indent=2)
+    with open(output_file, 'wb') as f:
+        f.write(orjson.dumps(docs, option=orjson.OPT_INDENT_2))
     print(f"Saved {len(docs)} documents to {output_file}")
 
 if __name__ == "__main__":
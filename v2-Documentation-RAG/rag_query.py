@@ -1,9 +1,14 @@
 """RAG query pipeline - retrieve relevant docs and answer questions"""
 import json
 import pickle
-from typing import List, Dict
+import re
+import sys
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Tuple
 import numpy as np
-import gensim.downloader as api
 import os
 import requests
 
@@ -14,6 +19,7 @@ except ImportError:
     FAISS_AVAILABLE = False
 
 try:
+    import httpx
     from openai import OpenAI
     LMSTUDIO_AVAILABLE = True
 except ImportError:
@@ -25,16 +31,26 @@ try:
 except ImportError:
     ANTHROPIC_AVAILABLE = False
 
-# Load embedding model
-EMBEDDING_DIM = 300
+# Load embedding model (same encoder the index was built with)
 try:
-    EMBEDDING_MODEL = api.load("word2vec-google-news-300")
+    from embed_and_store import EMBEDDING_DIM, encode_texts, load_embedding_model
+    EMBEDDING_MODEL = load_embedding_model()
     MODEL_AVAILABLE = True
 except Exception as e:
     EMBEDDING_MODEL = None
     MODEL_AVAILABLE = False
     print(f"Warning: Could not load embedding model: {e}")
 
+# Query-time search breadth for HNSW indexes
+HNSW_EF_SEARCH = 64
+
+# Retrieval cache: entries per RAGSystem and how long (seconds) each stays valid
+RETRIEVE_CACHE_SIZE = 1024
+RETRIEVE_CACHE_TTL = 3600
+
+# Concurrent LLM calls in batch_query
+BATCH_LLM_WORKERS = 4
+
 # LM Studio configuration
 LMSTUDIO_BASE_URL = os.getenv("LMSTUDIO_BASE_URL", "http://192.168.1.98:1234/v1")
 LMSTUDIO_MODEL = os.getenv("LMSTUDIO_MODEL", "qwen/qwen3-4b-2507")
@@ -42,21 +58,8 @@ LMSTUDIO_API_KEY = os.getenv("LMSTUDIO_API_KEY", "not-needed")
 
 
 def text_to_embedding(text: str, model) -> np.ndarray:
-    """Convert text to embedding by averaging word vectors"""
-    words = text.lower().split()
-    embeddings = []
-
-    for word in words:
-        try:
-            if word in model:
-                embeddings.append(model[word])
-        except KeyError:
-            pass
-
-    if embeddings:
-        return np.mean(embeddings, axis=0).astype('float32')
-    else:
-        return np.zeros(EMBEDDING_DIM, dtype='float32')
+    """Convert text to a sentence embedding"""
+    return encode_texts([text], model)[0]
 
 
 class RAGSystem:
@@ -71,25 +74,119 @@ class RAGSystem:
         if not MODEL_AVAILABLE:
             raise ImportError("Embedding model not available")
 
+        if not os.path.exists(index_path):
+            raise FileNotFoundError(f"Index file not found: {index_path}")
         self.index = faiss.read_index(index_path)
-        with open(metadata_path, 'rb') as f:
-            self.chunks = pickle.load(f)
 
-        print(f"RAG system loaded with {len(self.chunks)} chunks")
+        if self.index.d != EMBEDDING_DIM:
+            raise ValueError(
+                f"Index holds {self.index.d}-dim vectors but the embedding model produces "
+                f"{EMBEDDING_DIM}; rebuild it with embed_and_store.py"
+            )
+
+        if isinstance(self.index, faiss.IndexHNSWFlat):
+            self.index.hnsw.efSearch = HNSW_EF_SEARCH
+        if not os.path.exists(metadata_path):
+            raise FileNotFoundError(f"Metadata file not found: {metadata_path}")
+        self.metadata_path = metadata_path
+        self._chunks = None
+        self._source_urls = None
+
+        # (normalized query, k) -> ((chunk index, distance) hits, inserted_at)
+        self._retrieve_cache: "OrderedDict[Tuple[str, int], Tuple[tuple, float]]" = OrderedDict()
+
+        # LLM clients are reused across queries so keep-alive connections are pooled;
+        # building one opens no sockets, the Anthropic one is only needed for that backend
+        self._lmstudio = None
+        if LMSTUDIO_AVAILABLE:
+            self._lmstudio = OpenAI(
+                base_url=LMSTUDIO_BASE_URL,
+                api_key=LMSTUDIO_API_KEY,
+                http_client=httpx.Client(limits=httpx.Limits(max_keepalive_connections=10)),
+            )
+        self._anthropic = None
+        self._anthropic_lock = threading.Lock()
+
+        print(f"RAG system loaded with {self.index.ntotal} chunks")
+
+    @property
+    def chunks(self) -> List[Dict]:
+        """Chunk metadata, unpickled on first use"""
+        if self._chunks is None:
+            with open(self.metadata_path, 'rb') as f:
+                self._chunks = pickle.load(f)
+        return self._chunks
+
+    @property
+    def source_urls(self) -> List[str]:
+        """Distinct chunk URLs in corpus order, computed once"""
+        if self._source_urls is None:
+            self._source_urls = list(dict.fromkeys(chunk['url'] for chunk in self.chunks))
+        return self._source_urls
+
+    @property
+    def anthropic_client(self) -> "anthropic.Anthropic":
+        """Anthropic client, created on first use"""
+        if self._anthropic is None:
+            with self._anthropic_lock:
+                if self._anthropic is None:
+                    self._anthropic = anthropic.Anthropic()
+        return self._anthropic
 
     def retrieve(self, query: str, k: int = 5) -> List[Dict]:
         """Retrieve top-k most relevant chunks for a query"""
-        # Embed query using same method as chunks
-        query_embedding = text_to_embedding(query, EMBEDDING_MODEL)
-        query_embedding = np.expand_dims(query_embedding, axis=0)
-
-        # Search FAISS index
-        distances, indices = self.index.search(query_embedding, k)
-
-        # Get relevant chunks
+        return self.batch_retrieve([query], k=k)[0]
+
+    def batch_retrieve(self, queries: List[str], k: int = 5) -> List[List[Dict]]:
+        """Retrieve top-k chunks for several queries with a single FAISS search"""
+        # The uncased tokenizer lowercases and splits on whitespace, so these queries embed identically
+        keys = [(re.sub(r"\s+", " ", q.lower().strip()), k) for q in queries]
+        hits = [self._cache_get(key) for key in keys]
+
+        missing = [i for i, h in enumerate(hits) if h is None]
+        if missing:
+            searched = self._search([queries[i] for i in missing], k)
+            for i, h in zip(missing, searched):
+                hits[i] = h
+                self._cache_put(keys[i], h)
+
+        return [self._build_results(h) for h in hits]
+
+    def _cache_get(self, key: Tuple[str, int]):
+        """Return cached hits for key, or None if absent or expired"""
+        cached = self._retrieve_cache.get(key)
+        if cached is None or time.time() - cached[1] >= RETRIEVE_CACHE_TTL:
+            return None
+        self._retrieve_cache.move_to_end(key)
+        return cached[0]
+
+    def _cache_put(self, key: Tuple[str, int], hits: tuple) -> None:
+        """Store hits for key, evicting the least recently used entry when full"""
+        self._retrieve_cache[key] = (hits, time.time())
+        self._retrieve_cache.move_to_end(key)
+        if len(self._retrieve_cache) > RETRIEVE_CACHE_SIZE:
+            self._retrieve_cache.popitem(last=False)
+
+    def _search(self, queries: List[str], k: int) -> List[tuple]:
+        """Embed queries and search FAISS, returning (chunk index, distance) hits per query"""
+        # Embed queries using same method as chunks (unit-length), one row per query
+        query_embeddings = encode_texts(queries, EMBEDDING_MODEL)
+
+        # Search FAISS index once for the whole batch
+        distances, indices = self.index.search(query_embeddings, k)
+        return [
+            tuple((int(idx), float(distance)) for idx, distance in zip(row_indices, row_distances))
+            for row_indices, row_distances in zip(indices, distances)
+        ]
+
+    def _build_results(self, hits: tuple) -> List[Dict]:
+        """Turn (chunk index, distance) hits into result dicts"""
         results = []
-        for idx, distance in zip(indices[0], distances[0]):
-            chunk = self.chunks[int(idx)]
+        for idx, distance in hits:
+            if idx < 0:
+                # FAISS pads with -1 when fewer than k neighbors were found
+                continue
+            chunk = self.chunks[idx]
             results.append({
                 'distance': float(distance),
                 'chunk_id': chunk['chunk_id'],
@@ -121,7 +218,8 @@ class RAGSystem:
 
         return context
 
-    def query(self, question: str, k: int = 5, use_llm: bool = True, llm_backend: str = "lmstudio") -> Dict:
+    def query(self, question: str, k: int = 5, use_llm: bool = True, llm_backend: str = "lmstudio",
+              stream: bool = False) -> Dict:
         """
         Answer a question using RAG
 
@@ -130,13 +228,18 @@ class RAGSystem:
             k: Number of chunks to retrieve
             use_llm: Use LLM to synthesize answer
             llm_backend: "lmstudio" or "claude"
+            stream: Print the LM Studio answer to stdout as tokens arrive
 
         Returns:
             Dict with answer, sources, and retrieved chunks
         """
         # Retrieve relevant chunks
         results = self.retrieve(question, k=k)
+        return self._answer(question, results, use_llm, llm_backend, stream=stream)
 
+    def _answer(self, question: str, results: List[Dict], use_llm: bool, llm_backend: str,
+                stream: bool = False) -> Dict:
+        """Build the response for a question from its retrieved chunks"""
         response = {
             'question': question,
             'sources': [r['url'] for r in results],
@@ -153,22 +256,23 @@ class RAGSystem:
 
         # Use LLM to synthesize answer
         if llm_backend == "lmstudio":
-            return self._query_lmstudio(question, results, response)
+            return self._query_lmstudio(question, results, response, stream=stream)
         elif llm_backend == "claude":
             return self._query_claude(question, results, response)
         else:
             response['answer'] = f"Unknown LLM backend: {llm_backend}"
             return response
 
-    def _query_lmstudio(self, question: str, results: List[Dict], response: Dict) -> Dict:
-        """Query using LM Studio (local Qwen)"""
+    def _query_lmstudio(self, question: str, results: List[Dict], response: Dict,
+                        stream: bool = False) -> Dict:
+        """Query using LM Studio (local Qwen), optionally printing tokens as they arrive"""
         if not LMSTUDIO_AVAILABLE:
             response['answer'] = "OpenAI SDK not installed. Install with: pip install openai"
+            if stream:
+                print(response['answer'])
             return response
 
         try:
-            client = OpenAI(base_url=LMSTUDIO_BASE_URL, api_key=LMSTUDIO_API_KEY)
-
             # Limit context for 4K context models
             context = self.format_context(results, max_chars=1500)
             prompt = f"""{context}
@@ -176,19 +280,35 @@ Question: {question}
 
 Answer concisely:"""
 
-            message = client.chat.completions.create(
+            message = self._lmstudio.chat.completions.create(
                 model=LMSTUDIO_MODEL,
                 messages=[
                     {"role": "user", "content": prompt}
                 ],
                 temperature=0.5,
                 max_tokens=256,
+                stream=stream,
             )
 
-            response['answer'] = message.choices[0].message.content
+            if not stream:
+                response['answer'] = message.choices[0].message.content
+                return response
+
+            buf = []
+            for event in message:
+                if not event.choices:
+                    continue
+                tok = event.choices[0].delta.content or ""
+                sys.stdout.write(tok)
+                sys.stdout.flush()
+                buf.append(tok)
+            sys.stdout.write("\n")
+            response['answer'] = "".join(buf)
 
         except Exception as e:
             response['answer'] = f"Error calling LM Studio: {e}"
+            if stream:
+                print(f"\n{response['answer']}")
 
         return response
 
@@ -199,8 +319,6 @@ Answer concisely:"""
             return response
 
         try:
-            client = anthropic.Anthropic()
-
             context = self.format_context(results)
             prompt = f"""{context}
 
@@ -209,7 +327,7 @@ Question: {question}
 Based on the documentation above, provide a clear and concise answer to the question.
 If the information is not available in the documentation, say so."""
 
-            message = client.messages.create(
+            message = self.anthropic_client.messages.create(
                 model="claude-3-5-sonnet-20241022",
                 max_tokens=1024,
                 messages=[
@@ -224,16 +342,23 @@ If the information is not available in the documentation, say so."""
 
         return response
 
-    def batch_query(self, questions: List[str], k: int = 5) -> List[Dict]:
-        """Answer multiple questions"""
-        return [self.query(q, k=k) for q in questions]
+    def batch_query(self, questions: List[str], k: int = 5, use_llm: bool = True,
+                    llm_backend: str = "lmstudio") -> List[Dict]:
+        """Answer multiple questions, retrieving in one batch and calling the LLM concurrently"""
+        all_results = self.batch_retrieve(questions, k=k)
+
+        with ThreadPoolExecutor(max_workers=BATCH_LLM_WORKERS) as executor:
+            return list(executor.map(
+                lambda qr: self._answer(qr[0], qr[1], use_llm, llm_backend),
+                zip(questions, all_results),
+            ))
 
 
 def interactive_mode():
     """Run interactive RAG query mode"""
     try:
         rag = RAGSystem()
-    except (ImportError, FileNotFoundError) as e:
+    except (ImportError, FileNotFoundError, ValueError) as e:
         print(f"Error loading RAG system: {e}")
         print("Make sure you've run fetch_docs.py, chunk_docs.py, and embed_and_store.py first")
         return
@@ -254,11 +379,7 @@ def interactive_mode():
 
         if question.lower() == 'sources':
             print("\nAvailable sources:")
-            urls_seen = set()
-            for chunk in rag.chunks:
-                if chunk['url'] not in urls_seen:
-                    print(f"  - {chunk['url']}")
-                    urls_seen.add(chunk['url'])
+            print("\n".join(f"  - {url}" for url in rag.source_urls))
             continue
 
         if question.lower() == 'mode':
@@ -272,10 +393,16 @@ def interactive_mode():
             continue
 
         print("\nRetrieving relevant documentation...")
-        result = rag.query(question, k=5, use_llm=use_llm, llm_backend=llm_backend)
 
-        print(f"\n--- Answer ---")
-        print(result['answer'])
+        # LM Studio answers are printed token by token as they arrive
+        stream = use_llm and llm_backend == "lmstudio"
+        if stream:
+            print(f"\n--- Answer ---")
+        result = rag.query(question, k=5, use_llm=use_llm, llm_backend=llm_backend, stream=stream)
+
+        if not stream:
+            print(f"\n--- Answer ---")
+            print(result['answer'])
 
         print(f"\n--- Sources ---")
         for i, source in enumerate(result['sources'], 1):
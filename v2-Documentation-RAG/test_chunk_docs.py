@@ -0,0 +1,40 @@
+"""Tests for chunk_docs.chunk_text"""
+from chunk_docs import chunk_text
+
+
+def test_trailing_separator_adds_no_overlap_only_chunk():
+    a, b = "a" * 150, "b" * 150
+    chunks = chunk_text(f"{a}\n\n{b}\n\n", chunk_size=200, overlap=50)
+    assert chunks == [a, f"{'a' * 50}\n\n{b}"]
+
+
+def test_trailing_separator_after_flush():
+    x, y = "x" * 50, "y" * 160
+    # x is no longer than the overlap, so it isn't carried into the next chunk
+    assert chunk_text(f"{x}\n\n{y}\n\n", chunk_size=200, overlap=50) == [x, y]
+
+
+def test_short_chunk_is_not_copied_into_the_next():
+    chunks = chunk_text("ab\n\n" + "c" * 99, chunk_size=100, overlap=50)
+    assert chunks == ["ab", "c" * 99]
+
+
+def test_overlap_tail_starts_next_chunk():
+    a, b = "a" * 150, "b" * 150
+    assert chunk_text(f"{a}\n\n{b}", chunk_size=200, overlap=20) == [a, "a" * 20 + "\n\n" + b]
+
+
+def test_blank_text_gives_no_chunks():
+    assert chunk_text(" \n\n \n\n") == []
+
+
+def test_long_paragraph_is_split_to_fit_chunk_size():
+    text = "".join(str(i % 10) for i in range(1000))
+    chunks = chunk_text(text, chunk_size=500, overlap=100)
+    # Each chunk is the previous chunk's 100-char tail, a separator, then new text
+    assert "".join(chunk[102:] if i else chunk for i, chunk in enumerate(chunks)) == text
+    assert all(len(chunk) <= 500 + 2 for chunk in chunks)
+
+
+def test_custom_separator():
+    assert chunk_text("one\ntwo", chunk_size=5, overlap=0, separator="\n") == ["one", "two"]